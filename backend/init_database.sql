@@ -82,6 +82,8 @@ CREATE TABLE IF NOT EXISTS game_players (
 
 CREATE INDEX IF NOT EXISTS idx_game_players_game_id ON game_players(game_id);
 CREATE INDEX IF NOT EXISTS idx_game_players_username ON game_players(username);
+-- Covering index so the active games player-count join is an index-only scan
+CREATE INDEX IF NOT EXISTS idx_game_players_game_covering ON game_players(game_id) INCLUDE (username);
 
 -- Game session history (for completed games)
 CREATE TABLE IF NOT EXISTS game_sessions (
@@ -295,6 +297,30 @@ WHERE ag.is_active = TRUE
 GROUP BY ag.game_id, ag.host_username, ag.created_at, ag.game_mode, ag.max_players
 ORDER BY ag.created_at DESC;
 
+-- Precomputed top leaderboard (each player's best entry), refreshed
+-- periodically by the server so public reads skip the join and sort
+CREATE MATERIALIZED VIEW IF NOT EXISTS leaderboard_top_mv AS
+SELECT * FROM (
+    SELECT DISTINCT ON (l.username)
+        l.id,
+        l.username,
+        l.score,
+        l.wave_reached,
+        l.survival_time,
+        l.date,
+        l.game_id,
+        p.last_login
+    FROM leaderboard l
+    LEFT JOIN players p ON l.username = p.username
+    ORDER BY l.username, l.score DESC
+) best
+ORDER BY score DESC
+LIMIT 1000;
+
+-- Unique index is required for REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_leaderboard_top_mv_username ON leaderboard_top_mv(username);
+CREATE INDEX IF NOT EXISTS idx_leaderboard_top_mv_score ON leaderboard_top_mv(score DESC);
+
 -- ============================================
 -- FUNCTIONS & TRIGGERS
 -- ============================================
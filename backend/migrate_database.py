@@ -114,6 +114,20 @@ class DatabaseMigration:
             print(f"  ✗ Error checking index {index_name}: {e}")
             return False
     
+    def check_materialized_view_exists(self, view_name):
+        """Check if a materialized view exists"""
+        try:
+            self.cursor.execute("""
+                SELECT EXISTS (
+                    SELECT 1 FROM pg_matviews 
+                    WHERE matviewname=%s
+                )
+            """, (view_name,))
+            return self.cursor.fetchone()[0]
+        except Exception as e:
+            print(f"  ✗ Error checking materialized view {view_name}: {e}")
+            return False
+    
     def apply_migration(self, migration_name, sql, check_func=None):
         """Apply a single migration with error handling"""
         try:
@@ -336,6 +350,53 @@ class DatabaseMigration:
             """
         )
         
+        # Migration 10: Precomputed top leaderboard
+        print("\nMigration 10: Create leaderboard_top_mv materialized view")
+        self.apply_migration(
+            "Create leaderboard_top_mv materialized view",
+            """
+            CREATE MATERIALIZED VIEW leaderboard_top_mv AS
+            SELECT * FROM (
+                SELECT DISTINCT ON (l.username)
+                    l.id, l.username, l.score, l.wave_reached, l.survival_time,
+                    l.date, l.game_id, p.last_login
+                FROM leaderboard l
+                LEFT JOIN players p ON l.username = p.username
+                ORDER BY l.username, l.score DESC
+            ) best
+            ORDER BY score DESC
+            LIMIT 1000;
+            """,
+            lambda: self.check_materialized_view_exists('leaderboard_top_mv')
+        )
+        
+        self.apply_migration(
+            "Create leaderboard_top_mv indexes",
+            """
+            CREATE UNIQUE INDEX idx_leaderboard_top_mv_username ON leaderboard_top_mv(username);
+            CREATE INDEX idx_leaderboard_top_mv_score ON leaderboard_top_mv(score DESC);
+            """,
+            lambda: self.check_index_exists('idx_leaderboard_top_mv_username')
+        )
+        
+        # Migration 11: Indexes for the active games listing
+        print("\nMigration 11: Create active games listing indexes")
+        self.apply_migration(
+            "Create idx_game_players_game_covering",
+            """
+            CREATE INDEX idx_game_players_game_covering ON game_players(game_id) INCLUDE (username);
+            """,
+            lambda: self.check_index_exists('idx_game_players_game_covering')
+        )
+        
+        self.apply_migration(
+            "Create idx_active_games_created",
+            """
+            CREATE INDEX idx_active_games_created ON active_games(created_at DESC);
+            """,
+            lambda: self.check_index_exists('idx_active_games_created')
+        )
+        
         # Print summary
         print("\n" + "="*60)
         print("Migration Summary")
@@ -26,49 +26,62 @@ def test_schema():
         print("Database Schema Verification")
         print("="*60 + "\n")
         
-        # Test 1: Check game_id column exists
-        print("Test 1: Checking leaderboard.game_id column...")
+        indexes = [
+            'idx_leaderboard_game_id',
+            'idx_leaderboard_game_score',
+            'idx_leaderboard_unique_player_game',
+            'idx_leaderboard_unique_player_global',
+            'idx_leaderboard_top_mv_username',
+            'idx_game_players_game_covering',
+            'idx_active_games_created'
+        ]
+        tables = ['game_sessions', 'player_stats', 'achievements', 'player_achievements']
+        views = ['leaderboard_top_mv']
+        
+        # Fetch every schema object Tests 1-4 look for in a single round-trip
         cursor.execute("""
-            SELECT EXISTS (
-                SELECT 1 FROM information_schema.columns 
+            SELECT 'column', column_name FROM information_schema.columns
                 WHERE table_name='leaderboard' AND column_name='game_id'
-            )
-        """)
-        assert cursor.fetchone()[0], "game_id column missing!"
+            UNION ALL
+            SELECT 'index', indexname FROM pg_indexes
+                WHERE indexname = ANY(%s)
+            UNION ALL
+            SELECT 'constraint', constraint_name FROM information_schema.table_constraints
+                WHERE constraint_name='fk_leaderboard_game' AND table_name='leaderboard'
+            UNION ALL
+            SELECT 'table', table_name FROM information_schema.tables
+                WHERE table_name = ANY(%s)
+            UNION ALL
+            SELECT 'view', matviewname FROM pg_matviews
+                WHERE matviewname = ANY(%s)
+        """, (indexes, tables, views))
+        found = set(cursor.fetchall())
+        
+        # Test 1: Check game_id column exists
+        print("Test 1: Checking leaderboard.game_id column...")
+        assert ('column', 'game_id') in found, "game_id column missing!"
         print("  ✓ game_id column exists\n")
         
         # Test 2: Check indexes
         print("Test 2: Checking indexes...")
-        indexes = [
-            'idx_leaderboard_game_id',
-            'idx_leaderboard_game_score',
-            'idx_leaderboard_unique_player_game',
-            'idx_leaderboard_unique_player_global'
-        ]
         for idx in indexes:
-            cursor.execute("SELECT EXISTS (SELECT 1 FROM pg_indexes WHERE indexname=%s)", (idx,))
-            assert cursor.fetchone()[0], f"{idx} missing!"
+            assert ('index', idx) in found, f"{idx} missing!"
             print(f"  ✓ {idx}")
         print()
         
         # Test 3: Check foreign key constraint
         print("Test 3: Checking foreign key constraints...")
-        cursor.execute("""
-            SELECT EXISTS (
-                SELECT 1 FROM information_schema.table_constraints 
-                WHERE constraint_name='fk_leaderboard_game' AND table_name='leaderboard'
-            )
-        """)
-        assert cursor.fetchone()[0], "fk_leaderboard_game constraint missing!"
+        assert ('constraint', 'fk_leaderboard_game') in found, "fk_leaderboard_game constraint missing!"
         print("  ✓ fk_leaderboard_game constraint exists\n")
         
         # Test 4: Check new tables
         print("Test 4: Checking new tables...")
-        tables = ['game_sessions', 'player_stats', 'achievements', 'player_achievements']
         for table in tables:
-            cursor.execute("SELECT EXISTS (SELECT 1 FROM information_schema.tables WHERE table_name=%s)", (table,))
-            assert cursor.fetchone()[0], f"{table} table missing!"
+            assert ('table', table) in found, f"{table} table missing!"
             print(f"  ✓ {table} table exists")
+        for view in views:
+            assert ('view', view) in found, f"{view} materialized view missing!"
+            print(f"  ✓ {view} materialized view exists")
         print()
         
         # Test 5: Check achievements data
@@ -19,6 +19,9 @@ class AuthManager:
         self.username: Optional[str] = None
         self.server_url: str = "http://3.19.244.138:8000"  # Default AWS EC2 IPv4
         
+        # Authorization header built once per token change
+        self._auth_headers: Dict[str, str] = {}
+        
         self.load_configuration()
     
     def load_configuration(self):
@@ -29,15 +32,23 @@ class AuthManager:
         # Then load auth credentials
         self.load_auth_token()
     
+    @staticmethod
+    def _read_json(path: str) -> Optional[Dict]:
+        """Read and parse a JSON file, returning None if it doesn't exist."""
+        try:
+            with open(path, "rb") as f:
+                return json.loads(f.read())
+        except FileNotFoundError:
+            return None
+    
     def load_server_config(self):
         """Load server URL from config file or use default."""
         try:
-            if os.path.exists(self.server_config_file):
-                with open(self.server_config_file, "r") as f:
-                    config = json.load(f)
-                    self.server_url = config.get("server_url", self.server_url)
-                    print(f"Server URL loaded from {self.server_config_file}: {self.server_url}")
-        except (FileNotFoundError, json.JSONDecodeError) as e:
+            config = self._read_json(self.server_config_file)
+            if config is not None:
+                self.server_url = config.get("server_url", self.server_url)
+                print(f"Server URL loaded from {self.server_config_file}: {self.server_url}")
+        except json.JSONDecodeError as e:
             print(f"Could not load server config, using default: {e}")
         
         print(f"Using server: {self.server_url}")
@@ -45,24 +56,24 @@ class AuthManager:
     def load_auth_token(self):
         """Load authentication token from client_config.json."""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, "r") as f:
-                    config = json.load(f)
-                    
-                    if config.get("token") and config.get("username"):
-                        self.auth_token = config.get("token")
-                        self.username = config.get("username")
-                        
-                        # Override server URL if present in client config
-                        if config.get("server_url"):
-                            self.server_url = config.get("server_url")
-                            print(f"Server URL overridden from client config: {self.server_url}")
-                        
-                        print(f"Authenticated as: {self.username}")
-                    else:
-                        print(f"Warning: {self.config_file} exists but missing token or username")
-            else:
+            config = self._read_json(self.config_file)
+            if config is None:
                 print(f"Warning: {self.config_file} not found")
+                return
+            
+            if config.get("token") and config.get("username"):
+                self.auth_token = config.get("token")
+                self.username = config.get("username")
+                self._update_auth_headers()
+                
+                # Override server URL if present in client config
+                if config.get("server_url"):
+                    self.server_url = config.get("server_url")
+                    print(f"Server URL overridden from client config: {self.server_url}")
+                
+                print(f"Authenticated as: {self.username}")
+            else:
+                print(f"Warning: {self.config_file} exists but missing token or username")
         except Exception as e:
             print(f"Error loading authentication: {e}")
     
@@ -70,12 +81,14 @@ class AuthManager:
         """Check if user is authenticated."""
         return self.auth_token is not None and self.username is not None
     
+    def _update_auth_headers(self):
+        """Rebuild the cached Authorization header from the current token."""
+        self._auth_headers = {"Authorization": f"Bearer {self.auth_token}"} if self.auth_token else {}
+    
     def get_auth_headers(self) -> Dict[str, str]:
         """Get authentication headers for API requests."""
-        headers = {}
-        if self.auth_token:
-            headers["Authorization"] = f"Bearer {self.auth_token}"
-        return headers
+        # Copy since callers (e.g. LeaderboardManager) update their headers in place
+        return self._auth_headers.copy()
     
     def save_credentials(self, username: str, token: str) -> bool:
         """Save authentication credentials to config file."""
@@ -90,6 +103,7 @@ class AuthManager:
             
             self.username = username
             self.auth_token = token
+            self._update_auth_headers()
             print(f"Credentials saved for {username}")
             return True
         except Exception as e:
@@ -100,12 +114,15 @@ class AuthManager:
         """Clear authentication credentials."""
         self.auth_token = None
         self.username = None
+        self._update_auth_headers()
         try:
-            if os.path.exists(self.config_file):
-                os.remove(self.config_file)
-            print("Credentials cleared")
+            os.remove(self.config_file)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Error clearing credentials: {e}")
+            return
+        print("Credentials cleared")
     
     def get_server_url(self) -> str:
         """Get the current server URL."""
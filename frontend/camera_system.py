@@ -8,11 +8,17 @@ import random
 class CameraSystem:
     """Manages camera position and effects like screen shake."""
     
+    # Fixed attribute set: faster attribute access in the per-sprite
+    # coordinate conversions called every frame
+    __slots__ = ('offset_x', 'offset_y', 'shake_amount', 'shake_duration',
+                 '_shake_offsets', 'target_x', 'target_y', 'smoothing')
+    
     def __init__(self):
         self.offset_x = 0
         self.offset_y = 0
         self.shake_amount = 0
         self.shake_duration = 0
+        self._shake_offsets = []  # Precomputed (x, y) offset per shake frame
         self.target_x = 0
         self.target_y = 0
         self.smoothing = 0.1  # Camera smoothing factor
@@ -27,6 +33,13 @@ class CameraSystem:
         """
         self.shake_amount = amount
         self.shake_duration = int(duration * 60)  # Convert to frames at 60 FPS
+        
+        # Draw every frame's offsets up front so update() only indexes
+        offsets = range(-amount, amount + 1)
+        self._shake_offsets = list(zip(
+            random.choices(offsets, k=self.shake_duration),
+            random.choices(offsets, k=self.shake_duration)
+        ))
     
     def update(self):
         """Update camera shake effect."""
@@ -38,9 +51,8 @@ class CameraSystem:
                 self.offset_x = 0
                 self.offset_y = 0
             else:
-                # Apply random shake within amount range
-                self.offset_x = random.randint(-self.shake_amount, self.shake_amount)
-                self.offset_y = random.randint(-self.shake_amount, self.shake_amount)
+                # Apply the precomputed random shake for this frame
+                self.offset_x, self.offset_y = self._shake_offsets[self.shake_duration]
     
     def follow_target(self, target_x: float, target_y: float, 
                      screen_width: int, screen_height: int):
@@ -95,12 +107,31 @@ class CameraSystem:
         Returns:
             Screen position tuple (x, y)
         """
-        return self.apply_to_position(x, y)
+        return (x - self.target_x + self.offset_x, y - self.target_y + self.offset_y)
     
     def world_to_screen(self, world_x: float, world_y: float) -> tuple:
         """Convert world coordinates to screen coordinates."""
-        return self.apply_to_position(world_x, world_y)
+        # Inlined rather than delegating to apply_to_position; this runs
+        # once per drawn sprite per frame
+        return (world_x - self.target_x + self.offset_x,
+                world_y - self.target_y + self.offset_y)
     
+    def world_to_screen_batch(self, xs, ys) -> tuple:
+        """
+        Convert many world coordinates to screen coordinates at once.
+
+        Args:
+            xs: NumPy array of world x positions
+            ys: NumPy array of world y positions
+
+        Returns:
+            Tuple of arrays (screen_xs, screen_ys)
+        """
+        # Fold the camera terms into one scalar per axis so each array is
+        # touched by a single vectorized subtraction
+        return (xs - (self.target_x - self.offset_x),
+                ys - (self.target_y - self.offset_y))
+
     def screen_to_world(self, screen_x: float, screen_y: float) -> tuple:
         """Convert screen coordinates to world coordinates."""
         world_x = screen_x + self.target_x - self.offset_x
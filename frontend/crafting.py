@@ -13,22 +13,51 @@ NEON_BLUE = (0, 195, 255)
 NEON_GREEN = (57, 255, 20)
 NEON_PINK = (255, 41, 117)
 
+# Key sets for handle_crafting_input (pygame key constants exist at import)
+_CRAFT_KEYS = frozenset((pygame.K_1, pygame.K_2, pygame.K_3))
+_CLOSE_KEYS = frozenset((pygame.K_c, pygame.K_ESCAPE))
+
+NOT_ENOUGH_RESOURCES = "Not enough resources!"
+
+# Upper bound on cached cost-text surfaces; oldest entries are dropped first
+COST_SURF_CACHE_SIZE = 256
+
 
 class CraftingRecipe:
     """Represents a crafting recipe for an item."""
     
+    # Fixed attribute set: no per-instance __dict__ and faster attribute access
+    __slots__ = ('name', 'internal_name', 'description', 'requirements', 'effect',
+                 'icon_color', '_req_items', '_cost_templates')
+    
     def __init__(self, name: str, description: str, requirements: Dict[str, int], 
                  effect: Dict[str, any], icon_color: tuple = WHITE):
         self.name = name
+        self.internal_name = name.lower().replace(" ", "_")  # e.g. "data_shield"
         self.description = description
         self.requirements = requirements  # e.g., {"code_fragments": 5, "energy_cores": 2}
         self.effect = effect  # e.g., {"type": "shield", "duration": 10, "amount": 50}
         self.icon_color = icon_color
+        # Requirements never change after construction; iterate a plain tuple
+        self._req_items = tuple(requirements.items())
+        # Cost label per requirement with only the player's amount left to
+        # fill in, e.g. ("Data Shards: {}/4", "data_shards", 4)
+        self._cost_templates = tuple(
+            (resource.replace("_", " ").title() + ": {}/" + str(amount), resource, amount)
+            for resource, amount in requirements.items()
+        )
 
 
 class CraftingSystem:
     """Handles all crafting-related functionality."""
     
+    # Fixed attribute set: the menu draw path reads these every open frame
+    __slots__ = ('font_sm', 'font_md', 'show_crafting', 'recipes', '_all_resource_keys',
+                 '_can_craft_cache', '_cache_fingerprint', '_static_surfs',
+                 '_cost_surf_cache', '_overlay', '_overlay_size', '_panel_surf',
+                 '_box_surfs',
+                 '_layout', '_layout_size', '_surfaces_converted')
+    
     def __init__(self, font_sm, font_md):
         self.font_sm = font_sm
         self.font_md = font_md
@@ -58,6 +87,48 @@ class CraftingSystem:
                 icon_color=NEON_BLUE
             )
         ]
+        
+        # can_craft results only change when one of these resource counts does
+        self._all_resource_keys = tuple(sorted(
+            set().union(*[r.requirements.keys() for r in self.recipes])
+        ))
+        self._can_craft_cache: Dict[int, bool] = {}
+        self._cache_fingerprint = None
+        
+        # Menu text never changes, so render it once instead of every frame
+        instructions = [
+            "Press 1-3 to craft items",
+            "Press C or ESC to close",
+            "Press E to use equipped tool"
+        ]
+        self._static_surfs = {
+            "title": self.font_md.render("CRAFTING MENU", True, NEON_BLUE),
+            "instructions": [self.font_sm.render(s, True, GRAY) for s in instructions],
+            "recipe_nums": [self.font_md.render(f"{i + 1}", True, WHITE)
+                            for i in range(len(self.recipes))],
+            "recipe_names": [self.font_md.render(r.name, True, r.icon_color)
+                             for r in self.recipes],
+            "recipe_descs": [self.font_sm.render(r.description, True, GRAY)
+                             for r in self.recipes]
+        }
+        
+        # Cost labels keyed by (resource, player_amount, required_amount); they
+        # only change when the player's resource counts do
+        self._cost_surf_cache: Dict[tuple, pygame.Surface] = {}
+        
+        # Full-screen dim overlay, rebuilt only when the screen size changes
+        self._overlay = None
+        self._overlay_size = (0, 0)
+        self._panel_surf = None
+        self._box_surfs = None  # Recipe box per can_craft state
+        
+        # Screen-space positions for the menu, rebuilt on resize
+        self._layout = None
+        self._layout_size = (0, 0)
+        
+        # Cached surfaces are converted to the display format on first draw,
+        # since that needs a display mode to exist
+        self._surfaces_converted = False
     
     def toggle_menu(self) -> bool:
         """Toggle crafting menu visibility. Returns new state."""
@@ -74,8 +145,24 @@ class CraftingSystem:
     
     def can_craft(self, recipe: CraftingRecipe, player_resources: Dict[str, int]) -> bool:
         """Check if player has enough resources to craft an item."""
-        for resource, amount in recipe.requirements.items():
-            if player_resources.get(resource, 0) < amount:
+        pr_get = player_resources.get
+        fingerprint = tuple([pr_get(r, 0) for r in self._all_resource_keys])
+        if fingerprint != self._cache_fingerprint:
+            self._can_craft_cache.clear()
+            self._cache_fingerprint = fingerprint
+        
+        key = id(recipe)
+        result = self._can_craft_cache.get(key)
+        if result is None:
+            result = self._compute_can_craft(recipe, player_resources)
+            self._can_craft_cache[key] = result
+        return result
+    
+    def _compute_can_craft(self, recipe: CraftingRecipe, player_resources: Dict[str, int]) -> bool:
+        """Check a recipe's requirements against the player's resources."""
+        pr_get = player_resources.get
+        for resource, amount in recipe._req_items:
+            if pr_get(resource, 0) < amount:
                 return False
         return True
     
@@ -102,7 +189,7 @@ class CraftingSystem:
         # Check if player has enough resources
         if not self.can_craft(recipe, player.resources):
             if on_failure:
-                on_failure(recipe, "Not enough resources!")
+                on_failure(recipe, NOT_ENOUGH_RESOURCES)
             return False
         
         # Deduct resources
@@ -111,7 +198,7 @@ class CraftingSystem:
         
         # Create the crafted item
         crafted_item = {
-            "name": recipe.name.lower().replace(" ", "_"),
+            "name": recipe.internal_name,
             "display_name": recipe.name,
             "description": recipe.description,
             "effect": recipe.effect.copy(),
@@ -120,9 +207,7 @@ class CraftingSystem:
             "durability": 10  # All crafted items start with 10 uses
         }
         
-        # Add to player's crafted items
-        if not hasattr(player, 'crafted_items'):
-            player.crafted_items = []
+        # Add to player's crafted items (Player initializes crafted_items)
         player.crafted_items.append(crafted_item)
         
         # Auto-equip if no tool is equipped
@@ -142,30 +227,71 @@ class CraftingSystem:
             List of tuples: [(text, color), ...]
         """
         cost_parts = []
-        for i, (resource, amount) in enumerate(recipe.requirements.items()):
+        for template, resource, amount in recipe._cost_templates:
             player_amount = player_resources.get(resource, 0)
             has_enough = player_amount >= amount
             color = GREEN if has_enough else RED
             
-            # Format resource name nicely
-            resource_name = resource.replace("_", " ").title()
-            text = f"{resource_name}: {player_amount}/{amount}"
-            
-            cost_parts.append((text, color))
+            cost_parts.append((template.format(player_amount), color))
         
         return cost_parts
     
-    def draw_crafting_ui(self, surface: pygame.Surface, screen_width: int, screen_height: int,
-                        player_resources: Dict[str, int]):
-        """Draw the crafting menu UI."""
-        if not self.show_crafting:
+    def get_recipe_cost_surfaces(self, recipe: CraftingRecipe,
+                                 player_resources: Dict[str, int]) -> List[pygame.Surface]:
+        """
+        Get rendered cost text surfaces for a recipe, reusing cached renders.
+        
+        Returns:
+            List of surfaces, one per required resource
+        """
+        cache = self._cost_surf_cache
+        cost_surfs = []
+        for template, resource, amount in recipe._cost_templates:
+            player_amount = player_resources.get(resource, 0)
+            key = (resource, player_amount, amount)
+            cost_surf = cache.get(key)
+            if cost_surf is None:
+                color = GREEN if player_amount >= amount else RED
+                cost_surf = self.font_sm.render(template.format(player_amount), True, color)
+                if self._surfaces_converted:
+                    cost_surf = cost_surf.convert_alpha()
+                
+                # FIFO eviction keeps the cache bounded
+                if len(cache) >= COST_SURF_CACHE_SIZE:
+                    del cache[next(iter(cache))]
+                cache[key] = cost_surf
+            cost_surfs.append(cost_surf)
+        
+        return cost_surfs
+    
+    def _convert_surfaces(self):
+        """Convert every cached surface to the display's pixel format."""
+        if pygame.display.get_surface() is None:
             return
         
-        # Semi-transparent overlay
-        overlay = pygame.Surface((screen_width, screen_height))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        surface.blit(overlay, (0, 0))
+        # Anti-aliased text and the rounded panel carry per-pixel alpha
+        static_surfs = self._static_surfs
+        for key, value in static_surfs.items():
+            if isinstance(value, list):
+                static_surfs[key] = [surf.convert_alpha() for surf in value]
+            else:
+                static_surfs[key] = value.convert_alpha()
+        
+        if self._overlay is not None:
+            self._overlay = self._overlay.convert_alpha()
+        if self._panel_surf is not None:
+            self._panel_surf = self._panel_surf.convert_alpha()
+        if self._box_surfs is not None:
+            self._box_surfs = {k: v.convert_alpha() for k, v in self._box_surfs.items()}
+        self._cost_surf_cache.clear()
+        
+        # Layout holds references to the old text surfaces
+        self._layout = None
+        self._surfaces_converted = True
+    
+    def _build_layout(self, screen_width: int, screen_height: int):
+        """Compute every fixed position in the crafting menu for a screen size."""
+        static_surfs = self._static_surfs
         
         # Crafting menu panel
         panel_width = 600
@@ -173,70 +299,144 @@ class CraftingSystem:
         panel_x = screen_width // 2 - panel_width // 2
         panel_y = screen_height // 2 - panel_height // 2
         
-        # Draw panel background
-        pygame.draw.rect(surface, (20, 20, 40), 
-                        (panel_x, panel_y, panel_width, panel_height),
-                        border_radius=10)
-        pygame.draw.rect(surface, NEON_BLUE, 
-                        (panel_x, panel_y, panel_width, panel_height), 3,
-                        border_radius=10)
+        # Panel background (rounded corners are rasterized only once)
+        if self._panel_surf is None:
+            panel_surf = pygame.Surface((panel_width, panel_height), pygame.SRCALPHA)
+            pygame.draw.rect(panel_surf, (20, 20, 40), 
+                            (0, 0, panel_width, panel_height),
+                            border_radius=10)
+            pygame.draw.rect(panel_surf, NEON_BLUE, 
+                            (0, 0, panel_width, panel_height), 3,
+                            border_radius=10)
+            if self._surfaces_converted:
+                panel_surf = panel_surf.convert_alpha()
+            self._panel_surf = panel_surf
+        
+        # Recipe boxes in both outline colors, also rasterized once
+        box_width, box_height = panel_width - 60, 80
+        if self._box_surfs is None:
+            box_surfs = {}
+            for can_craft, box_color in ((True, NEON_GREEN), (False, GRAY)):
+                box_surf = pygame.Surface((box_width, box_height), pygame.SRCALPHA)
+                pygame.draw.rect(box_surf, (30, 30, 50), (0, 0, box_width, box_height),
+                                border_radius=5)
+                pygame.draw.rect(box_surf, box_color, (0, 0, box_width, box_height), 2,
+                                border_radius=5)
+                if self._surfaces_converted:
+                    box_surf = box_surf.convert_alpha()
+                box_surfs[can_craft] = box_surf
+            self._box_surfs = box_surfs
+        
+        # Text that never changes gets its final rect up front
+        static_blits = []
         
         # Title
-        title_surf = self.font_md.render("CRAFTING MENU", True, NEON_BLUE)
-        title_rect = title_surf.get_rect(centerx=screen_width // 2, y=panel_y + 20)
-        surface.blit(title_surf, title_rect)
+        title_surf = static_surfs["title"]
+        static_blits.append((title_surf, title_surf.get_rect(centerx=screen_width // 2,
+                                                              y=panel_y + 20)))
         
         # Instructions
-        instructions = [
-            "Press 1-3 to craft items",
-            "Press C or ESC to close",
-            "Press E to use equipped tool"
-        ]
+        for i, inst_surf in enumerate(static_surfs["instructions"]):
+            static_blits.append((inst_surf, inst_surf.get_rect(centerx=screen_width // 2,
+                                                                y=panel_y + 60 + i * 20)))
         
-        for i, instruction in enumerate(instructions):
-            inst_surf = self.font_sm.render(instruction, True, GRAY)
-            inst_rect = inst_surf.get_rect(centerx=screen_width // 2, 
-                                          y=panel_y + 60 + i * 20)
-            surface.blit(inst_surf, inst_rect)
-        
-        # Draw recipes
+        # Recipes
         recipe_y_start = panel_y + 140
         recipe_spacing = 100
+        box_rects = []
+        cost_origins = []
         
-        for i, recipe in enumerate(self.recipes):
+        for i in range(len(self.recipes)):
             recipe_y = recipe_y_start + i * recipe_spacing
-            
-            # Recipe box
-            box_rect = pygame.Rect(panel_x + 30, recipe_y, panel_width - 60, 80)
-            can_craft = self.can_craft(recipe, player_resources)
-            box_color = NEON_GREEN if can_craft else GRAY
-            
-            pygame.draw.rect(surface, (30, 30, 50), box_rect, border_radius=5)
-            pygame.draw.rect(surface, box_color, box_rect, 2, border_radius=5)
+            box_rect = pygame.Rect(panel_x + 30, recipe_y, box_width, box_height)
+            box_rects.append(box_rect)
             
             # Recipe number
-            num_surf = self.font_md.render(f"{i + 1}", True, WHITE)
-            num_rect = num_surf.get_rect(midleft=(box_rect.x + 15, box_rect.centery))
-            surface.blit(num_surf, num_rect)
+            num_surf = static_surfs["recipe_nums"][i]
+            static_blits.append((num_surf, num_surf.get_rect(midleft=(box_rect.x + 15,
+                                                                      box_rect.centery))))
             
             # Recipe name
-            name_surf = self.font_md.render(recipe.name, True, recipe.icon_color)
-            name_rect = name_surf.get_rect(midleft=(box_rect.x + 50, box_rect.y + 15))
-            surface.blit(name_surf, name_rect)
+            name_surf = static_surfs["recipe_names"][i]
+            static_blits.append((name_surf, name_surf.get_rect(midleft=(box_rect.x + 50,
+                                                                        box_rect.y + 15))))
             
             # Recipe description
-            desc_surf = self.font_sm.render(recipe.description, True, GRAY)
-            desc_rect = desc_surf.get_rect(midleft=(box_rect.x + 50, box_rect.y + 35))
-            surface.blit(desc_surf, desc_rect)
+            desc_surf = static_surfs["recipe_descs"][i]
+            static_blits.append((desc_surf, desc_surf.get_rect(midleft=(box_rect.x + 50,
+                                                                        box_rect.y + 35))))
             
-            # Requirements
-            cost_parts = self.get_recipe_cost_text(recipe, player_resources)
-            cost_x = box_rect.x + 50
-            for j, (cost_text, cost_color) in enumerate(cost_parts):
-                cost_surf = self.font_sm.render(cost_text, True, cost_color)
-                cost_rect = cost_surf.get_rect(midleft=(cost_x, box_rect.y + 55 + j * 15))
-                surface.blit(cost_surf, cost_rect)
+            # Requirements start here and flow right
+            cost_origins.append((box_rect.x + 50, box_rect.y + 55))
+        
+        self._layout = {
+            "panel_pos": (panel_x, panel_y),
+            "static_blits": static_blits,
+            "box_rects": box_rects,
+            "cost_origins": cost_origins
+        }
+        self._layout_size = (screen_width, screen_height)
+    
+    def draw_crafting_ui(self, surface: pygame.Surface, screen_width: int, screen_height: int,
+                        player_resources: Dict[str, int]):
+        """
+        Draw the crafting menu UI.
+        
+        The menu is closed on almost every frame, so callers should guard with
+        ``if crafting.is_menu_open():`` to skip building the arguments too.
+        """
+        if not self.show_crafting:
+            return
+        return self._draw_crafting_ui_impl(surface, screen_width, screen_height,
+                                           player_resources)
+    
+    def _draw_crafting_ui_impl(self, surface: pygame.Surface, screen_width: int,
+                               screen_height: int, player_resources: Dict[str, int]):
+        """Draw the open crafting menu."""
+        if not self._surfaces_converted:
+            self._convert_surfaces()
+        
+        # Semi-transparent overlay
+        if self._overlay_size != (screen_width, screen_height):
+            # Alpha is baked into the pixels so SDL's per-pixel alpha
+            # blitters (SIMD with PYGAME_BLEND_ALPHA_SDL2=1) handle the blit
+            overlay = pygame.Surface((screen_width, screen_height), pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 180))
+            if self._surfaces_converted:
+                overlay = overlay.convert_alpha()
+            self._overlay = overlay
+            self._overlay_size = (screen_width, screen_height)
+        surface.blit(self._overlay, (0, 0))
+        
+        if self._layout is None or self._layout_size != (screen_width, screen_height):
+            self._build_layout(screen_width, screen_height)
+        layout = self._layout
+        
+        # Collect the panel, recipe boxes and every text surface and issue
+        # them as one batched blit
+        blit_seq = [(self._panel_surf, layout["panel_pos"])]
+        
+        # Recipe boxes, picking the pre-rendered outline for each state
+        box_surfs = self._box_surfs
+        for recipe, box_rect in zip(self.recipes, layout["box_rects"]):
+            blit_seq.append((box_surfs[self.can_craft(recipe, player_resources)], box_rect))
+        
+        blit_seq.extend(layout["static_blits"])
+        
+        # Requirements
+        for recipe, (cost_x, cost_y) in zip(self.recipes, layout["cost_origins"]):
+            cost_surfs = self.get_recipe_cost_surfaces(recipe, player_resources)
+            for j, cost_surf in enumerate(cost_surfs):
+                blit_seq.append((cost_surf, cost_surf.get_rect(midleft=(cost_x,
+                                                                        cost_y + j * 15))))
                 cost_x += cost_surf.get_width() + 20
+        
+        # fblits only exists in pygame-ce; plain pygame falls back to blits
+        fblits = getattr(surface, "fblits", None)
+        if fblits is not None:
+            fblits(blit_seq)
+        else:
+            surface.blits(blit_seq, doreturn=0)
     
     def handle_crafting_input(self, event: pygame.event.Event, player,
                              sound_callback: Optional[Callable] = None,
@@ -258,38 +458,19 @@ class CraftingSystem:
         
         if event.type == pygame.KEYDOWN:
             # Crafting selection (1-3 keys)
-            if event.key in [pygame.K_1, pygame.K_2, pygame.K_3]:
+            if event.key in _CRAFT_KEYS:
                 craft_index = event.key - pygame.K_1
                 
-                def on_success(recipe, item):
-                    if sound_callback:
-                        sound_callback("level_up")
-                    if effect_callback:
-                        effect_callback(
-                            "text", player.x, player.y - 30,
-                            text=f"Crafted {recipe.name}!",
-                            color=NEON_GREEN,
-                            size=20,
-                            duration=2.0
-                        )
-                
-                def on_failure(recipe, message):
-                    if sound_callback:
-                        sound_callback("hit")
-                    if effect_callback:
-                        effect_callback(
-                            "text", player.x, player.y - 30,
-                            text=message,
-                            color=RED,
-                            size=20,
-                            duration=2.0
-                        )
-                
-                self.craft_item(craft_index, player, on_success, on_failure)
+                if self.craft_item(craft_index, player):
+                    self._on_craft_success(self.recipes[craft_index], player,
+                                           sound_callback, effect_callback)
+                elif craft_index < len(self.recipes):
+                    self._on_craft_failure(NOT_ENOUGH_RESOURCES, player,
+                                           sound_callback, effect_callback)
                 return True
             
             # Close menu
-            elif event.key in [pygame.K_c, pygame.K_ESCAPE]:
+            elif event.key in _CLOSE_KEYS:
                 self.close_menu()
                 if sound_callback:
                     sound_callback("menu_select")
@@ -297,6 +478,36 @@ class CraftingSystem:
         
         return False
     
+    def _on_craft_success(self, recipe: CraftingRecipe, player,
+                          sound_callback: Optional[Callable],
+                          effect_callback: Optional[Callable]):
+        """Play feedback for a successful craft."""
+        if sound_callback:
+            sound_callback("level_up")
+        if effect_callback:
+            effect_callback(
+                "text", player.x, player.y - 30,
+                text=f"Crafted {recipe.name}!",
+                color=NEON_GREEN,
+                size=20,
+                duration=2.0
+            )
+    
+    def _on_craft_failure(self, message: str, player,
+                          sound_callback: Optional[Callable],
+                          effect_callback: Optional[Callable]):
+        """Play feedback for a failed craft."""
+        if sound_callback:
+            sound_callback("hit")
+        if effect_callback:
+            effect_callback(
+                "text", player.x, player.y - 30,
+                text=message,
+                color=RED,
+                size=20,
+                duration=2.0
+            )
+    
     def get_equipped_tool_name(self, player) -> Optional[str]:
         """Get the name of the currently equipped tool."""
         if hasattr(player, 'equipped_tool') and player.equipped_tool:
@@ -2,6 +2,24 @@ import pygame
 import random
 import math
 import os
+import numpy as np
+
+# Pre-drawn filled circles keyed by (color, radius); explosions shrink
+# through a few dozen integer radii, so each is drawn only once
+_circle_surface_cache = {}
+
+
+def get_circle_surface(color, radius):
+    """Return a transparent surface holding a filled circle centered at (radius, radius)."""
+    key = (color, radius)
+    surf = _circle_surface_cache.get(key)
+    if surf is None:
+        size = radius * 2 + 1
+        surf = pygame.Surface((size, size), pygame.SRCALPHA).convert_alpha()
+        pygame.draw.circle(surf, color, (radius, radius), radius)
+        _circle_surface_cache[key] = surf
+    return surf
+
 
 class GameEffects:
     def __init__(self, volume=0.7):
@@ -18,6 +36,9 @@ class GameEffects:
         # Visual effect properties
         self.particles = []
         self.text_effects = []
+        
+        # Fonts by size; building a Font parses the font file, so it is done once per size
+        self._fonts = {}
 
     def load_sounds(self):
         """Load all sound effects."""
@@ -112,27 +133,33 @@ class GameEffects:
 
     def update(self):
         """Update all active effects."""
+        # Survivors are collected in one pass; removing expired entries from
+        # a copy was quadratic in the effect count
         # Update particles
-        for particle in self.particles[:]:
+        particles = []
+        for particle in self.particles:
             particle["x"] += particle["dx"]
             particle["y"] += particle["dy"]
             particle["time"] += 1
             
-            # Remove expired particles
-            if particle["time"] >= particle["lifetime"]:
-                self.particles.remove(particle)
+            # Keep unexpired particles
+            if particle["time"] < particle["lifetime"]:
+                particles.append(particle)
+        self.particles = particles
         
         # Update text effects
-        for effect in self.text_effects[:]:
+        text_effects = []
+        for effect in self.text_effects:
             effect["time"] += 1
             
             # Move rising text upward
             if effect["rise"]:
                 effect["y"] -= 1
             
-            # Remove expired effects
-            if effect["time"] >= effect["duration"]:
-                self.text_effects.remove(effect)
+            # Keep unexpired effects
+            if effect["time"] < effect["duration"]:
+                text_effects.append(effect)
+        self.text_effects = text_effects
 
     def draw(self, surface):
         """Draw all active effects."""
@@ -160,8 +187,11 @@ class GameEffects:
                 # Fade out
                 alpha = 255 * (1 - (effect["time"] - effect["duration"] * 0.8) / (effect["duration"] * 0.2))
             
-            # Create font and render text
-            font = pygame.font.Font(None, effect["size"])
+            # Reuse the font for this size and render text
+            size = effect["size"]
+            font = self._fonts.get(size)
+            if font is None:
+                font = self._fonts[size] = pygame.font.Font(None, size)
             text_surface = font.render(effect["text"], True, effect["color"])
             text_surface.set_alpha(int(alpha))
             
@@ -173,3 +203,100 @@ class GameEffects:
         """Draws a health bar at the given position."""
         pygame.draw.rect(screen, (255, 0, 0), (x, y, width, height))  # Red background
         pygame.draw.rect(screen, (0, 255, 0), (x, y, width * (health / max_health), height))  # Green health fill
+
+
+class EffectParams:
+    """Drawing parameters for one pooled effect, read every frame it is drawn."""
+
+    # Fixed attribute set: smaller than the kwargs dict it replaces and read
+    # by slot access instead of dict.get() with a default
+    __slots__ = ('text', 'color', 'size', 'surf')
+
+    def __init__(self, text='', color=(255, 255, 255), size=20, surf=None):
+        self.text = text
+        self.color = color
+        self.size = size
+        self.surf = surf  # Text rendered once when the effect is emitted
+
+
+class EffectPool:
+    """Timed visual effects stored as parallel arrays (struct of arrays).
+
+    Timers, positions, types and per-effect parameters live in separate
+    NumPy arrays so the per-frame countdown and expiry are a vectorized
+    subtraction and one boolean-mask compaction instead of a Python loop.
+    """
+
+    GROW_BY = 128  # Capacity added whenever the pool fills up
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        """Remove all effects."""
+        self.size = 0
+        self.timers = np.empty(self.GROW_BY, dtype=np.float64)
+        self.xs = np.empty(self.GROW_BY, dtype=np.float64)
+        self.ys = np.empty(self.GROW_BY, dtype=np.float64)
+        self.types = np.empty(self.GROW_BY, dtype=object)
+        self.params = np.empty(self.GROW_BY, dtype=object)
+
+    def __len__(self):
+        return self.size
+
+    def add(self, effect_type, x, y, timer, params):
+        """Append an effect, growing the arrays in GROW_BY chunks when full.
+
+        params is an EffectParams record stored as-is.
+        """
+        i = self.size
+        if i == len(self.timers):
+            self.timers = np.concatenate((self.timers, np.empty(self.GROW_BY, dtype=np.float64)))
+            self.xs = np.concatenate((self.xs, np.empty(self.GROW_BY, dtype=np.float64)))
+            self.ys = np.concatenate((self.ys, np.empty(self.GROW_BY, dtype=np.float64)))
+            self.types = np.concatenate((self.types, np.empty(self.GROW_BY, dtype=object)))
+            self.params = np.concatenate((self.params, np.empty(self.GROW_BY, dtype=object)))
+
+        self.timers[i] = timer
+        self.xs[i] = x
+        self.ys[i] = y
+        self.types[i] = effect_type
+        self.params[i] = params
+        self.size = i + 1
+
+    def update(self):
+        """Count every timer down one frame and drop expired effects."""
+        n = self.size
+        if n == 0:
+            return
+
+        timers = self.timers[:n]
+        timers -= 1
+        keep = np.flatnonzero(timers > 0)
+        kept = len(keep)
+        if kept == n:
+            return
+
+        # Compact survivors to the front, preserving draw order. The survivor
+        # indices are found once and shared by every array, where a boolean
+        # mask would be rescanned for each of them
+        for arr in (self.timers, self.xs, self.ys, self.types, self.params):
+            arr[:kept] = arr[keep]
+        self.types[kept:n] = None
+        self.params[kept:n] = None
+        self.size = kept
+
+    def active_on_screen(self, camera_system, shake_x=0, shake_y=0):
+        """Iterate (type, x, y, screen_x, screen_y, timer, params) for every live effect.
+
+        Screen positions for the whole pool come from one vectorized camera
+        transform rather than a world_to_screen call per effect.
+        """
+        n = self.size
+        screen_xs, screen_ys = camera_system.world_to_screen_batch(self.xs[:n], self.ys[:n])
+        screen_xs += shake_x
+        screen_ys += shake_y
+        return zip(self.types[:n], self.xs[:n], self.ys[:n],
+                   screen_xs.tolist(), screen_ys.tolist(),
+                   self.timers[:n], self.params[:n])
+
@@ -3,12 +3,82 @@ import random
 import json
 import asyncio
 import websockets
+import orjson
 import math
+import numpy as np
 from typing import Dict
 from effects import GameEffects
 
+# Health bar geometry and the rendered bar for each filled width
+HEALTH_BAR_WIDTH = 40
+HEALTH_BAR_HEIGHT = 4
+_health_bar_cache = {}
+
+
+def get_health_bar_surface(health_width):
+    """Return the health bar for a given filled width, rendering it once."""
+    bar = _health_bar_cache.get(health_width)
+    if bar is None:
+        # Overfull bars (health above max) spill past the border, as drawn before
+        bar = pygame.Surface((max(HEALTH_BAR_WIDTH, health_width), HEALTH_BAR_HEIGHT)).convert()
+        pygame.draw.rect(bar, (100, 0, 0), (0, 0, HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT))
+        pygame.draw.rect(bar, (255, 0, 0), (0, 0, health_width, HEALTH_BAR_HEIGHT))
+        pygame.draw.rect(bar, (255, 255, 255), (0, 0, HEALTH_BAR_WIDTH, HEALTH_BAR_HEIGHT), 1)
+        _health_bar_cache[health_width] = bar
+    return bar
+
+
+# Below this many enemies the per-enemy step() beats building component arrays
+BATCH_STEP_MIN_ENEMIES = 16
+
+
+def step_enemies(enemies, player):
+    """
+    Advance the AI of every enemy by one frame, as Enemy.step() would.
+
+    Positions, speeds and ranges are gathered into NumPy component arrays so
+    the range tests and chase movement run as vectorized operations; the
+    results are then written back to the enemies that attack, chase or idle.
+
+    Returns:
+        List of booleans aligned with enemies, True where attack_player() is due
+    """
+    if len(enemies) < BATCH_STEP_MIN_ENEMIES:
+        return [enemy.active and enemy.step(player) for enemy in enemies]
+
+    components = np.array([(enemy.x, enemy.y, enemy.speed, enemy.attack_range,
+                            enemy.chase_range, enemy.active) for enemy in enemies])
+    xs, ys, speeds, attack_ranges, chase_ranges, active = components.T
+    active = active.astype(bool)
+
+    dx = player.x - xs
+    dy = player.y - ys
+    distance_sq = dx * dx + dy * dy
+    attack = active & (distance_sq < attack_ranges * attack_ranges)
+    chase = active & ~attack & (distance_sq < chase_ranges * chase_ranges)
+    idle = active & ~attack & ~chase
+
+    # Same step as chase_player(): toward the player at the enemy's speed
+    distance = np.maximum(0.1, np.sqrt(distance_sq))
+    new_xs = xs + dx / distance * speeds
+    new_ys = ys + dy / distance * speeds
+
+    for i in np.flatnonzero(attack).tolist():
+        enemies[i].state = "attack"
+    chasing = np.flatnonzero(chase)
+    for i, x, y in zip(chasing.tolist(), new_xs[chasing].tolist(), new_ys[chasing].tolist()):
+        enemy = enemies[i]
+        enemy.state = "chase"
+        enemy.x = x
+        enemy.y = y
+        enemy.queue_sync()
+    for i in np.flatnonzero(idle).tolist():
+        enemies[i].state = "idle"
+    return attack.tolist()
+
+
 class Enemy:
-    def __init__(self, sprite_sheet, x, y, server_url):
+    def __init__(self, sprite_sheet, x, y, server_url, action_queue=None):
         self.x = x
         self.y = y
         self.speed = 1.5
@@ -37,6 +107,8 @@ class Enemy:
         self.attack_frames = []
         
         self.server_url = server_url
+        self.action_queue = action_queue  # Drained by the game's action worker
+        self._sync_pending = False
         self.active = True  # Set active to True by default
         self.effects = GameEffects()
         self.width = 48  # Set default width for the enemy
@@ -54,7 +126,7 @@ class Enemy:
                 self.attack_frames = [self.get_frame(sprite_sheet, i, 5) for i in range(4)]
         else:
                 # Create a fallback sprite
-                fallback = pygame.Surface((48, 48), pygame.SRCALPHA)
+                fallback = pygame.Surface((48, 48), pygame.SRCALPHA).convert_alpha()
                 fallback.fill((255, 0, 0))  # Red color for visibility
                 pygame.draw.rect(fallback, (255, 255, 255), fallback.get_rect(), 2)  # White border
                 self.walk_right = [fallback] * 4
@@ -93,25 +165,33 @@ class Enemy:
         if not player or not self.active:
             return
 
-        # Calculate distance to player
-        #dx = player.x - self.x
-        #dy = player.y - self.y
-        #distance = math.sqrt(dx*dx + dy*dy)
-         # Calculate distance to player
-        distance = ((self.x - player.x) ** 2 + (self.y - player.y) ** 2) ** 0.5
+        if self.step(player):
+            await self.attack_player(player)
 
+    def step(self, player):
+        """
+        Advance the enemy AI by one frame without awaiting anything.
+
+        Returns:
+            True if the player is in attack range and attack_player() is due
+        """
+        # Squared distances against squared ranges; no square root needed
+        # just to pick a state
+        dx = player.x - self.x
+        dy = player.y - self.y
+        distance_sq = dx * dx + dy * dy
 
         # Update state based on distance
-        if distance < self.attack_range:
+        if distance_sq < self.attack_range * self.attack_range:
             self.state = "attack"
-            await self.attack_player(player)
-        elif distance < self.chase_range:
+            return True
+        if distance_sq < self.chase_range * self.chase_range:
             self.state = "chase"
             # Use the chase_player method to update position
             self.chase_player(player)
         else:
             self.state = "idle"
-
+        return False
 
     def chase_player(self, player):
         dx = player.x - self.x
@@ -125,9 +205,21 @@ class Enemy:
         
         self.x += dx
         self.y += dy
+        self.queue_sync()
+
+    def queue_sync(self):
+        """Schedule sync_enemy_state() after this enemy moved."""
+        # Don't wait for server sync - queue it and continue. Only one sync
+        # per enemy is pending at a time; it sends the latest position.
+        if self.action_queue is not None:
+            if not self._sync_pending:
+                try:
+                    self.action_queue.put_nowait(self.sync_enemy_state)
+                    self._sync_pending = True
+                except asyncio.QueueFull:
+                    pass
+            return
         
-                
-        # Don't wait for server sync - create task and continue
         try:
             asyncio.create_task(self.sync_enemy_state())
         except RuntimeError:
@@ -136,9 +228,10 @@ class Enemy:
 
     async def sync_enemy_state(self):
         """Synchronize enemy state to server - safely handle connection issues."""
+        self._sync_pending = False
         try:
             async with websockets.connect(self.server_url, timeout=1) as websocket:
-                update_data = json.dumps({"type": "enemy_update", "x": self.x, "y": self.y, "health": self.health})
+                update_data = orjson.dumps({"type": "enemy_update", "x": self.x, "y": self.y, "health": self.health}).decode()
                 await websocket.send(update_data)
         except (websockets.exceptions.WebSocketException, ConnectionRefusedError, asyncio.TimeoutError):
             # Silently fail if server connection fails - don't block the chase behavior
@@ -273,6 +366,17 @@ class Enemy:
         # Draw health bar above enemy
         self.draw_health_bar(surface, screen_x, screen_y)
     
+    def add_blits(self, blits, camera_system):
+        """Append this enemy's sprite and health bar to a blit sequence."""
+        if not self.sprite:
+            return
+        
+        screen_x, screen_y = camera_system.world_to_screen(self.x, self.y)
+        health_width = max(0, int(HEALTH_BAR_WIDTH * self.health / self.max_health))
+        blits.append((self.sprite, (screen_x, screen_y)))
+        blits.append((get_health_bar_surface(health_width),
+                      (screen_x + (self.sprite_width - HEALTH_BAR_WIDTH) // 2, screen_y - 10)))
+    
     def draw_health_bar(self, surface, screen_x, screen_y):
         """Draw health bar above enemy."""
         bar_width = 40
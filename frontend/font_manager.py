@@ -3,8 +3,9 @@
 Font Manager for loading and managing game fonts.
 """
 import pygame
+import io
 import os
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
 class FontManager:
@@ -13,6 +14,9 @@ class FontManager:
     def __init__(self):
         pygame.font.init()
         self.fonts: Dict[str, pygame.font.Font] = {}
+        self._font_specs: Dict[str, Tuple[str, int]] = {}
+        self._font_data: Dict[str, bytes] = {}  # Raw TTF bytes per file path
+        self._default_fonts: Dict[int, pygame.font.Font] = {}  # System font per size
         
         # Get the directory where this file is located
         self.base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -21,7 +25,7 @@ class FontManager:
         self.load_fonts()
     
     def load_fonts(self):
-        """Load all game fonts with fallback to system fonts."""
+        """Register all game fonts; each one is loaded on first use."""
         font_configs = [
             ("title", "PropolishRufftu-BLLyd.ttf", 60),
             ("button", "GlitchGoblin-2O87v.ttf", 40),
@@ -33,46 +37,65 @@ class FontManager:
         ]
         
         for name, filename, size in font_configs:
-            path = os.path.join(self.fonts_dir, filename)
+            self._font_specs[name] = (os.path.join(self.fonts_dir, filename), size)
+    
+    def get_font(self, name: str) -> Optional[pygame.font.Font]:
+        """Get a font by name, loading it with fallback to system fonts on first use."""
+        font = self.fonts.get(name)
+        if font is None and name in self._font_specs:
+            path, size = self._font_specs[name]
             try:
-                self.fonts[name] = pygame.font.Font(path, size)
-                print(f"Loaded font '{name}' from {filename}")
+                # Several sizes share one file; read it once and give each
+                # Font its own stream over the same bytes
+                data = self._font_data.get(path)
+                if data is None:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                    self._font_data[path] = data
+                font = pygame.font.Font(io.BytesIO(data), size)
+                print(f"Loaded font '{name}' from {os.path.basename(path)}")
             except Exception as e:
                 print(f"Warning: Could not load font '{name}' from {path}: {e}")
                 print(f"Using system font for '{name}'")
-                self.fonts[name] = pygame.font.Font(None, size)
+                font = pygame.font.Font(None, size)
+            self.fonts[name] = font
+        return font
     
-    def get_font(self, name: str) -> Optional[pygame.font.Font]:
-        """Get a font by name."""
-        return self.fonts.get(name)
+    def get_default_font(self, size: int) -> pygame.font.Font:
+        """Get pygame's default font at a given size, creating it once per size."""
+        font = self._default_fonts.get(size)
+        if font is None:
+            font = pygame.font.Font(None, size)
+            self._default_fonts[size] = font
+        return font
     
     def get_title_font(self) -> pygame.font.Font:
         """Get title font."""
-        return self.fonts.get("title", pygame.font.Font(None, 60))
+        return self.get_font("title")
     
     def get_button_font(self) -> pygame.font.Font:
         """Get button font."""
-        return self.fonts.get("button", pygame.font.Font(None, 40))
+        return self.get_font("button")
     
     def get_info_font(self) -> pygame.font.Font:
         """Get info font."""
-        return self.fonts.get("info", pygame.font.Font(None, 24))
+        return self.get_font("info")
     
     def get_xl_font(self) -> pygame.font.Font:
         """Get extra large font."""
-        return self.fonts.get("xl", pygame.font.Font(None, 48))
+        return self.get_font("xl")
     
     def get_lg_font(self) -> pygame.font.Font:
         """Get large font."""
-        return self.fonts.get("lg", pygame.font.Font(None, 36))
+        return self.get_font("lg")
     
     def get_md_font(self) -> pygame.font.Font:
         """Get medium font."""
-        return self.fonts.get("md", pygame.font.Font(None, 24))
+        return self.get_font("md")
     
     def get_sm_font(self) -> pygame.font.Font:
         """Get small font."""
-        return self.fonts.get("sm", pygame.font.Font(None, 18))
+        return self.get_font("sm")
     
     def add_custom_font(self, name: str, path: str, size: int) -> bool:
         """
@@ -92,4 +115,16 @@ class FontManager:
             return True
         except Exception as e:
             print(f"Error adding custom font '{name}': {e}")
-            return False
\ No newline at end of file
+            return False
+
+
+# Shared instance so every caller reuses the same loaded fonts
+_FONT_MANAGER: Optional[FontManager] = None
+
+
+def get_font_manager() -> FontManager:
+    """Get the shared FontManager, creating it on first use."""
+    global _FONT_MANAGER
+    if _FONT_MANAGER is None:
+        _FONT_MANAGER = FontManager()
+    return _FONT_MANAGER
@@ -1,19 +1,19 @@
 # game.py (REFACTORED - COMPLETE VERSION)
 import pygame
 import sys
-import random
 import math
+import numpy as np
 import requests
 import os
-import json
 import asyncio
 import websockets
 import time
+from collections import OrderedDict, defaultdict, deque
 from datetime import datetime
 
 # Import existing game modules
-from effects import GameEffects
-from enemy import Enemy
+from effects import GameEffects, EffectParams, EffectPool, get_circle_surface
+from enemy import Enemy, step_enemies
 from world import WorldGenerator
 from worldObject import WorldObject, Resource
 from player import Player
@@ -25,7 +25,7 @@ from settings_manager import SettingsManager
 from auth_manager import AuthManager
 from leaderboard_manager import LeaderboardManager
 from state_manager import StateManager
-from font_manager import FontManager
+from font_manager import get_font_manager
 from camera_system import CameraSystem
 
 pygame.init()
@@ -52,12 +52,58 @@ NEON_PINK = (255, 41, 117)
 NEON_RED = (255, 49, 49)
 NEON_PURPLE = (190, 0, 255)
 
+# Rendered text surfaces kept by Game._cached_text before the least recently
+# drawn one is dropped
+TEXT_CACHE_SIZE = 256
+
+# Enemy drops: chance that a defeated enemy drops anything, then the
+# weighted pick of its type (cumulative weights for np.searchsorted)
+RESOURCE_DROP_CHANCE = 0.8
+RESOURCE_DROP_TYPES = ("code_fragments", "energy_cores", "data_shards")
+RESOURCE_DROP_CUM_WEIGHTS = np.cumsum([0.5, 0.3, 0.2])
+RESOURCE_DROP_CUM_WEIGHTS /= RESOURCE_DROP_CUM_WEIGHTS[-1]
+
+# Display names for resource types ("data_shards" -> "Data Shards"), built once
+RESOURCE_LABELS = {rtype: rtype.replace("_", " ").title() for rtype in RESOURCE_DROP_TYPES}
+
+# Collected Resource objects kept by Game for reuse by later drops
+RESOURCE_POOL_SIZE = 128
+
+# Sprite image locations, resolved once at import
+SPRITE_DIR = os.path.join(os.path.dirname(__file__), "spritesheets")
+PLAYER_SHEET_PATH = os.path.join(SPRITE_DIR, "player-spritesheet.png")
+ENEMY_SHEET_PATH = os.path.join(SPRITE_DIR, "enemy-spritesheet.png")
+RESOURCE_SPRITE_DIR = os.path.join(SPRITE_DIR, "resources")
+
+# A plain software window: present_frame() relies on display.update(rects)
+# pushing only the dirty rects, which a SCALED (renderer-backed) display
+# turns into a full-frame upload; the layout follows the window size
+DISPLAY_FLAGS = pygame.RESIZABLE
+
 
 class Game:
     """Main game class - refactored with modular managers."""
     
     # Custom event IDs
     GAME_OVER_EVENT_ID = pygame.USEREVENT + 1
+    # Fired once, WAVE_DELAY_MS after the last enemy of a wave dies
+    WAVE_READY_EVENT_ID = pygame.USEREVENT + 2
+    WAVE_DELAY_MS = 5000
+    
+    # Static screens that only push changed widget rects to the display;
+    # the menu animates across the whole window so it stays on flip(), as
+    # does gameplay, where enemies, particles and data streams are redrawn
+    # all over the window every frame
+    PARTIAL_UPDATE_STATES = frozenset(("pause", "game_over", "leaderboard", "settings"))
+    
+    # Remote players are drawn this far in the past, between received samples,
+    # and dead-reckoned at most this far past the newest one (then eased back
+    # onto it over the same time if no newer sample arrives)
+    REMOTE_INTERP_DELAY = 0.1
+    REMOTE_EXTRAPOLATE_LIMIT = 0.25
+    
+    # Enemy count multiplier per difficulty setting
+    DIFFICULTY_MULTIPLIERS = {"Easy": 0.7, "Normal": 1.0, "Hard": 2.0}
     
     def __init__(self):
         # Initialize pygame
@@ -66,23 +112,58 @@ class Game:
         pygame.display.init()
         
         # Create resizable screen
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
+        self.screen = self.set_display_mode((WIDTH, HEIGHT))
         pygame.display.set_caption("CodeBreak")
+        
+        # Nothing reads these events (mouse position comes from
+        # pygame.mouse.get_pos(), held keys from pygame.key.get_pressed()),
+        # so keep them out of the queue entirely
+        pygame.event.set_blocked([
+            pygame.MOUSEMOTION, pygame.ACTIVEEVENT,
+            pygame.WINDOWMOVED, pygame.WINDOWENTER, pygame.WINDOWLEAVE,
+            pygame.KEYUP, pygame.TEXTINPUT, pygame.TEXTEDITING, pygame.MOUSEWHEEL
+        ])
         self.current_width = WIDTH
         self.current_height = HEIGHT
         pygame.display.flip()
         
-        # Initialize clock
-        self.clock = pygame.time.Clock()
+        # Frame rate; run() paces frames with time.perf_counter()
         self.FPS = 60
+        # Frame clock (perf_counter seconds), read once at the top of each
+        # frame so every subsystem times the frame against the same instant
+        self._now = time.perf_counter()
         
         # Initialize all managers (NEW - replaces scattered initialization)
-        self.font_manager = FontManager()
+        self.font_manager = get_font_manager()
         self.settings_manager = SettingsManager()
+        self._cache_gameplay_settings()
         self.auth_manager = AuthManager()
+        # Spawn bursts draw all their random positions in one call each
+        self._rng = np.random.default_rng()
     # Use a 5-second fade (duration measured in frames). FPS is defined above.
         self.state_manager = StateManager(initial_state="menu", transition_duration=int(5 * self.FPS))
         self.state_manager.set_game_instance(self)  # Set game reference for state handlers
+        # Per-state frame handlers, all called as (events, mouse_pos, dt, buckets)
+        self._state_handlers = {
+            "menu": self.state_manager.handle_menu_state,
+            "gameplay": self.handle_gameplay_state,
+            "pause": self.state_manager.handle_pause_state,
+            "game_over": self.state_manager.handle_game_over_state,
+            "leaderboard": self.state_manager.handle_leaderboard_state,
+            "settings": self.state_manager.handle_settings_state,
+        }
+        # Window-level events handled in run() before the state handler,
+        # each called with that frame's events of its type
+        self._window_event_handlers = {
+            pygame.QUIT: self._on_quit,
+            self.WAVE_READY_EVENT_ID: self._on_wave_ready,
+            pygame.VIDEORESIZE: self._on_resize,
+        }
+        self._running = False
+        # Break between waves: milliseconds left, and when the timer was last
+        # (re)started, or None while frozen; both None when no break is pending
+        self._wave_break_remaining_ms = None
+        self._wave_break_started = None
         self.camera_system = CameraSystem()
         self.ui_manager = UIManager(WIDTH, HEIGHT)
         self.crafting_system = CraftingSystem(
@@ -120,8 +201,9 @@ class Game:
         self.player = None
         self.enemies = []
         self.resources = []
+        self._resource_pool = []  # Collected resources waiting to be reused
         self.power_ups = []
-        self.effects_list = []
+        self.effect_pool = EffectPool()  # Timed visual effects (text, explosions)
         
         # Game metrics
         self.score = 0
@@ -131,7 +213,6 @@ class Game:
         self.wave_number = 0
         self.enemies_to_spawn = 0
         self.spawn_timer = 0
-        self.next_wave_timer = 0
         
         # World generation
         self.world_generator = None
@@ -148,6 +229,11 @@ class Game:
         # Screen shake effect
         self.screen_shake_amount = 0
         self.screen_shake_duration = 0
+        # Full-strength (+/-10 px) shake offsets drawn once and cycled through;
+        # each shake scales them to its intensity when it starts
+        self._shake_table = self._rng.integers(-10, 10, size=(256, 2), endpoint=True).tolist()
+        self._shake_offsets = self._shake_table
+        self._shake_index = 0
         self.camera_offset_x = 0
         self.camera_offset_y = 0
         
@@ -155,14 +241,24 @@ class Game:
         self.other_players = {}
         self.teammates = []
         self.last_position_update = 0
-        self.last_frame_time = pygame.time.get_ticks()
+        self._presented_key = None
         self.websocket = None
         self.websocket_task = None
+        # Background coroutines (enemy syncs) run one at a time on a single worker
+        self._action_queue = asyncio.Queue(maxsize=256)
+        self._action_worker_task = None
         self.connected_to_server = False
         self.connection_attempts = 0
         self.session_id = None
         self.score_submitted = False
 
+        # Rendered text surfaces keyed by (font id, text, color), in LRU order
+        self._text_cache = OrderedDict()
+        # Top-left HUD (wave, health, resources) composited into one surface,
+        # rebuilt only when one of its values changes
+        self._hud_panel_key = None
+        self._hud_panel = None
+        
         # Pending actions (used for fade transitions)
         self.pending_restart = False
         
@@ -179,6 +275,7 @@ class Game:
         
         # Create chat system if it exists
         # self.chat_system = ChatSystem(self.font_manager.get_sm_font())
+        self.chat_system = None
         
         # Create UI elements using the new UI manager
         self.create_all_ui_elements()
@@ -244,6 +341,7 @@ class Game:
     def update_setting(self, key: str, value):
         """Update a setting value."""
         self.settings_manager.update_setting(key, value)
+        self._cache_gameplay_settings()
         
         # Apply audio settings immediately
         if key == "sound_volume":
@@ -252,29 +350,47 @@ class Game:
             # Apply to music system if you have one
             pass
     
+    def _cache_gameplay_settings(self):
+        """Copy settings read during gameplay into plain attributes."""
+        # Refreshed whenever a setting changes, so the shake and wave code
+        # never goes through the settings manager per frame
+        self._screen_shake_enabled = bool(self.settings_manager.get_setting("screen_shake"))
+        self._difficulty_factor = self.DIFFICULTY_MULTIPLIERS.get(
+            self.settings_manager.get_setting("difficulty"), 1.0
+        )
+    
+    def set_display_mode(self, size) -> pygame.Surface:
+        """Open (or resize) the game window at the given size."""
+        return pygame.display.set_mode(size, DISPLAY_FLAGS)
+    
     def play_sound(self, sound_name: str):
         """Play a sound effect."""
-        if hasattr(self.effects, 'play'):
-            self.effects.play(sound_name)
+        self.effects.play_sound(sound_name)
     
     def add_effect(self, effect_type: str, x: float, y: float, **kwargs):
         """Add a visual effect."""
-        effect = {
-            'type': effect_type,
-            'x': x,
-            'y': y,
-            'timer': kwargs.get('duration', 1.0) * 60,
-            **kwargs
-        }
-        self.effects_list.append(effect)
+        params = EffectParams(kwargs.get('text', ''), kwargs.get('color', WHITE), kwargs.get('size', 20))
+        if effect_type == 'text':
+            # Rendered here once; draw_effect only positions and blits it
+            font = self.font_manager.get_default_font(params.size)
+            params.surf = self._cached_text(font, params.text, params.color)
+        self.effect_pool.add(effect_type, x, y, kwargs.get('duration', 1.0) * 60, params)
     
     def start_screen_shake(self, amount: int, duration: float):
         """Start screen shake effect."""
-        if self.settings_manager.get_setting("screen_shake"):
+        if self._screen_shake_enabled:
             self.camera_system.start_shake(amount, duration)
     
-    async def handle_gameplay_state(self, events=None, dt=1/60):
-        """Handle gameplay state."""
+    async def handle_gameplay_state(self, events=None, mouse_pos=None, dt=1/60, buckets=None):
+        """
+        Handle gameplay state.
+        
+        Args:
+            events: This frame's UI (mouse button) events; unused here
+            mouse_pos: Current mouse position; unused here
+            dt: Frame time in seconds
+            buckets: This frame's events grouped by event type
+        """
         # Initialize game world if needed (only if player doesn't exist AND we haven't just initialized)
         if not self.player:
             # Check if we're in the middle of a fade - if so, skip async init
@@ -286,39 +402,41 @@ class Game:
         keys = pygame.key.get_pressed()
         
         # Handle events
-        for event in events or []:
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                sys.exit()
-            elif hasattr(self, 'game_over_event_id') and event.type == self.game_over_event_id:
-                pygame.time.set_timer(self.game_over_event_id, 0)
-                self.state_manager.transition_to("game_over")
-                return
-            elif hasattr(self, 'chat_system') and self.chat_system.handle_event(event, self.player):
+        buckets = buckets or {}
+        if buckets.get(pygame.QUIT):
+            pygame.quit()
+            sys.exit()
+        if buckets.get(self.game_over_event_id):
+            pygame.time.set_timer(self.game_over_event_id, 0)
+            self.state_manager.transition_to("game_over")
+            return
+        
+        for event in buckets.get(pygame.KEYDOWN, ()):
+            if self.chat_system and self.chat_system.handle_event(event, self.player):
                 continue
-            elif event.type == pygame.KEYDOWN:
-                # Resource sharing removed
-                
-                # Crafting menu toggle
-                if event.key == pygame.K_c:
-                    self.crafting_system.toggle_menu()
+            
+            # Resource sharing removed
+            
+            # Crafting menu toggle
+            if event.key == pygame.K_c:
+                self.crafting_system.toggle_menu()
+                self.play_sound("menu_select")
+            
+            # ESC handling
+            elif event.key == pygame.K_ESCAPE:
+                if self.crafting_system.is_menu_open():
+                    self.crafting_system.close_menu()
                     self.play_sound("menu_select")
-                
-                # ESC handling
-                elif event.key == pygame.K_ESCAPE:
-                    if self.crafting_system.is_menu_open():
-                        self.crafting_system.close_menu()
-                        self.play_sound("menu_select")
-                    else:
-                        self.state_manager.transition_to("pause")
-                
-                # Crafting input handling (delegated to crafting system)
-                elif self.crafting_system.handle_crafting_input(
-                    event, self.player,
-                    sound_callback=self.play_sound,
-                    effect_callback=self.add_effect
-                ):
-                    continue
+                else:
+                    self.state_manager.transition_to("pause")
+            
+            # Crafting input handling (delegated to crafting system)
+            elif self.crafting_system.handle_crafting_input(
+                event, self.player,
+                sound_callback=self.play_sound,
+                effect_callback=self.add_effect
+            ):
+                continue
         
         # Handle continuous gameplay actions when crafting menu is closed
         if not self.crafting_system.is_menu_open():
@@ -331,14 +449,18 @@ class Game:
             # Check for resource collection
             if self.player and self.resources:
                 collected = self.player.check_resource_collision(self.resources)
-                for resource in collected:
-                    self.resources.remove(resource)
+                if collected:
+                    # One filtering pass instead of a list.remove() scan per pickup
+                    collected_ids = {id(resource) for resource in collected}
+                    self.resources = [r for r in self.resources if id(r) not in collected_ids]
+                    self._release_resources(collected)
             
             # Check if player is dead
             if self.player and self.player.health <= 0:
                 print("Player defeated! Transitioning to game over...")
                 self.final_score = self.score
-                self.final_survival_time = (pygame.time.get_ticks() - self.game_start_time) // 1000
+                self.final_survival_time = int(self.survival_time)
+                self._cancel_wave_timer()
                 # Switch immediately to game over (no fade) so the screen appears right away.
                 self.state_manager.transition_to("game_over", fade=False)
                 return
@@ -353,74 +475,112 @@ class Game:
         self.draw_gameplay_elements()
         
         # Draw crafting UI on top if active
-        self.crafting_system.draw_crafting_ui(
-            self.screen, 
-            self.current_width, 
-            self.current_height,
-            self.player.resources if self.player else {}
-        )
+        if self.crafting_system.is_menu_open():
+            self.crafting_system.draw_crafting_ui(
+                self.screen, 
+                self.current_width, 
+                self.current_height,
+                self.player.resources if self.player else {}
+            )
         
         # Always draw UI
         self.draw_gameplay_ui()
         
-        # Send position updates for multiplayer
-        if self.player and self.player.is_moving and hasattr(self, 'websocket') and self.websocket:
-            asyncio.create_task(self.send_position_update())
+        # Multiplayer position updates are sent by Player.position_sender over
+        # the player's own connection, including the final resting position
+        # once movement stops
+    
+    def _cached_text(self, font, text: str, color) -> pygame.Surface:
+        """Render text, reusing the surface while the same text is drawn."""
+        key = (id(font), text, color)
+        cache = self._text_cache
+        text_surf = cache.get(key)
+        if text_surf is None:
+            # Converted once so the per-frame blits skip pixel-format conversion
+            text_surf = font.render(text, True, color).convert_alpha()
+            if len(cache) >= TEXT_CACHE_SIZE:
+                cache.popitem(last=False)
+            cache[key] = text_surf
+        else:
+            # Lines drawn every frame (wave, health) stay cached while the
+            # ticking timer text churns through the old entries
+            cache.move_to_end(key)
+        return text_surf
     
     def draw_gameplay_ui(self):
         """Draw gameplay UI elements."""
         if not self.player:
             return
         
+        # Every HUD line is collected here and drawn with one blits() call
+        hud_blits = []
+        
         # Show equipped tool
         equipped_tool_name = self.crafting_system.get_equipped_tool_name(self.player)
         if equipped_tool_name:
-            tool_text = self.font_manager.get_sm_font().render(
+            tool_text = self._cached_text(
+                self.font_manager.get_sm_font(),
                 f"Equipped: {equipped_tool_name} (Press E to use)",
-                True, NEON_BLUE
+                NEON_BLUE
             )
-            self.screen.blit(tool_text, (10, self.current_height - 30))
+            hud_blits.append((tool_text, (10, self.current_height - 30)))
         
         # Show score (top right)
-        score_text = self.font_manager.get_md_font().render(
+        score_text = self._cached_text(
+            self.font_manager.get_md_font(),
             f"Score: {self.score}",
-            True, WHITE
+            WHITE
         )
-        self.screen.blit(score_text, (self.current_width - score_text.get_width() - 20, 20))
+        hud_blits.append((score_text, (self.current_width - score_text.get_width() - 20, 20)))
         
         # Show survival timer (top right, below score)
-        minutes = int(self.survival_time // 60)
-        seconds = int(self.survival_time % 60)
-        time_text = self.font_manager.get_md_font().render(
+        minutes, seconds = divmod(int(self.survival_time), 60)
+        time_text = self._cached_text(
+            self.font_manager.get_md_font(),
             f"Time: {minutes:02d}:{seconds:02d}", 
-            True, WHITE
-        )
-        self.screen.blit(time_text, (self.current_width - time_text.get_width() - 20, 50))
-        
-        # Show wave (top left)
-        wave_text = self.font_manager.get_md_font().render(
-            f"Wave: {self.wave_number}",
-            True, WHITE
+            WHITE
         )
-        self.screen.blit(wave_text, (10, 10))
+        hud_blits.append((time_text, (self.current_width - time_text.get_width() - 20, 50)))
         
-        # Show health (top left, below wave)
-        health_text = self.font_manager.get_md_font().render(
-            f"Health: {self.player.health}/{self.player.max_health}",
-            True, GREEN if self.player.health > 50 else RED
+        # Show wave, health and resources (top left) as one pre-composited panel
+        panel_key = (
+            self.wave_number, self.player.health, self.player.max_health,
+            tuple(self.player.resources.items()),
+            id(self.font_manager.get_md_font()), id(self.font_manager.get_sm_font())
         )
-        self.screen.blit(health_text, (10, 40))
+        if panel_key != self._hud_panel_key:
+            self._hud_panel = self._build_hud_panel()
+            self._hud_panel_key = panel_key
+        hud_blits.append((self._hud_panel, (10, 10)))
         
-        # Show resources (top left, below health)
-        y_offset = 70
+        self.screen.blits(hud_blits, doreturn=False)
+    
+    def _build_hud_panel(self) -> pygame.Surface:
+        """Composite the wave, health and resource lines into one surface."""
+        md_font = self.font_manager.get_md_font()
+        sm_font = self.font_manager.get_sm_font()
+        
+        # Wave, then health below it, then one line per resource
+        lines = [
+            (self._cached_text(md_font, f"Wave: {self.wave_number}", WHITE), 0),
+            (self._cached_text(
+                md_font,
+                f"Health: {self.player.health}/{self.player.max_health}",
+                GREEN if self.player.health > 50 else RED
+            ), 30),
+        ]
+        y_offset = 60
         for resource, amount in self.player.resources.items():
-            resource_name = resource.replace("_", " ").title()
-            resource_text = self.font_manager.get_sm_font().render(
-                f"{resource_name}: {amount}",
-                True, CYAN
-            )
-            self.screen.blit(resource_text, (10, y_offset))
+            resource_name = RESOURCE_LABELS.get(resource) or resource.replace("_", " ").title()
+            lines.append((self._cached_text(sm_font, f"{resource_name}: {amount}", CYAN), y_offset))
             y_offset += 25
+        
+        width = max(surf.get_width() for surf, _ in lines)
+        height = max(y + surf.get_height() for surf, y in lines)
+        panel = pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        panel.fill((0, 0, 0, 0))
+        panel.blits([(surf, (0, y)) for surf, y in lines], doreturn=False)
+        return panel
     
     # ==================== GAME WORLD METHODS ====================
     
@@ -434,12 +594,7 @@ class Game:
         
         for resource_type in resource_types:
             try:
-                sprite_path = os.path.join(
-                    os.path.dirname(__file__), 
-                    "spritesheets", 
-                    "resources", 
-                    f"{resource_type}.png"
-                )
+                sprite_path = os.path.join(RESOURCE_SPRITE_DIR, f"{resource_type}.png")
                 sprite = pygame.image.load(sprite_path).convert_alpha()
                 self.resource_sprites[resource_type] = sprite
                 print(f"Loaded resource sprite: {resource_type}")
@@ -451,14 +606,28 @@ class Game:
                     "energy_cores": (255, 215, 0),      # Gold
                     "data_shards": (255, 41, 117)       # Pink
                 }
-                fallback = pygame.Surface((24, 24), pygame.SRCALPHA)
+                fallback = pygame.Surface((24, 24), pygame.SRCALPHA).convert_alpha()
                 fallback.fill(fallback_colors.get(resource_type, (255, 255, 255)))
                 self.resource_sprites[resource_type] = fallback
     
-    async def initialize_game_world(self):
-        """Initialize the game world."""
-        print("Initializing game world...")
-        
+    def _load_sprite_sheet(self, path: str, label: str, fallback_color) -> pygame.Surface:
+        """Load a sprite sheet, or a plain colored square if the file can't be read."""
+        try:
+            sheet = pygame.image.load(path).convert_alpha()
+            print(f"Loaded {label} sprite sheet from {path}")
+            return sheet
+        except Exception as e:
+            print(f"Could not load {label} sprite: {e}")
+            # Create a simple colored surface as fallback
+            sheet = pygame.Surface((32, 32)).convert()
+            sheet.fill(fallback_color)
+            return sheet
+    
+    def _init_game_world_core(self):
+        """Build the player, world generator and fresh game state.
+
+        Shared by the async initializer and the synchronous restart path.
+        """
         # Load resource sprites
         self.load_resource_sprites()
         
@@ -473,16 +642,7 @@ class Game:
             
             # Load player sprite sheet if needed
             if not self.player_sprite_sheet:
-                try:
-                    import os
-                    sprite_path = os.path.join(os.path.dirname(__file__), "spritesheets", "player-spritesheet.png")
-                    self.player_sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-                    print(f"Loaded player sprite sheet from {sprite_path}")
-                except Exception as e:
-                    print(f"Could not load player sprite: {e}")
-                    # Create a simple colored surface as fallback
-                    self.player_sprite_sheet = pygame.Surface((32, 32))
-                    self.player_sprite_sheet.fill(NEON_BLUE)
+                self.player_sprite_sheet = self._load_sprite_sheet(PLAYER_SHEET_PATH, "player", NEON_BLUE)
             
             self.player = Player(self.player_sprite_sheet, spawn_x, spawn_y)
             
@@ -493,14 +653,16 @@ class Game:
                 screen_shake_callback=self.start_screen_shake
             )
         
-        # Initialize game state
+        # Initialize game state; a wave timer left from a previous game must not fire
+        self._cancel_wave_timer()
         self.enemies = []
+        self._release_resources(self.resources)
         self.resources = []
         self.power_ups = []
-        self.effects_list = []
+        self.effect_pool.clear()
         self.score = 0
         self.survival_time = 0
-        self.game_start_time = pygame.time.get_ticks()
+        self.game_start_time = self._now
         
         # Start first wave
         self.wave_number = 1
@@ -508,67 +670,23 @@ class Game:
         
         # Spawn initial resources across the map
         self.spawn_initial_resources()
-        
+
+    async def initialize_game_world(self):
+        """Initialize the game world."""
+        print("Initializing game world...")
+        self._init_game_world_core()
         print("Game world initialized successfully!")
+        await asyncio.sleep(0)
 
     def initialize_game_world_sync(self):
         """Synchronous version of game world initialization used for immediate restarts.
 
-        This mirrors the logic in the async initializer but runs synchronously so
-        the UI shows the gameplay screen immediately after the Play Again click.
+        Runs the same core as the async initializer so the UI shows the
+        gameplay screen immediately after the Play Again click.
         """
         try:
             print("Initializing game world (sync)...")
-            
-            # Load resource sprites
-            self.load_resource_sprites()
-
-            # Create world generator
-            if not self.world_generator:
-                self.world_generator = WorldGenerator(WIDTH, HEIGHT, TILE_SIZE)
-
-            # Create player
-            if not self.player:
-                spawn_x = WIDTH // 2
-                spawn_y = HEIGHT // 2
-
-                # Load player sprite sheet if needed
-                if not self.player_sprite_sheet:
-                    try:
-                        import os
-                        sprite_path = os.path.join(os.path.dirname(__file__), "spritesheets", "player-spritesheet.png")
-                        self.player_sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-                        print(f"Loaded player sprite sheet from {sprite_path}")
-                    except Exception as e:
-                        print(f"Could not load player sprite: {e}")
-                        self.player_sprite_sheet = pygame.Surface((32, 32))
-                        self.player_sprite_sheet.fill(NEON_BLUE)
-
-                self.player = Player(self.player_sprite_sheet, spawn_x, spawn_y)
-
-                # Set up player callbacks for effects and sounds
-                self.player.set_callbacks(
-                    sound_callback=self.play_sound,
-                    effect_callback=self.add_effect,
-                    screen_shake_callback=self.start_screen_shake
-                )
-
-            # Initialize game state
-            self.enemies = []
-            self.resources = []
-            self.power_ups = []
-            self.effects_list = []
-            self.score = 0
-            self.survival_time = 0
-            self.game_start_time = pygame.time.get_ticks()
-
-            # Start first wave
-            self.wave_number = 1
-            self.spawn_wave()
-            
-            # Spawn initial resources across the map
-            self.spawn_initial_resources()
-
+            self._init_game_world_core()
             print("Game world initialized successfully! (sync)")
         except Exception as e:
             print("Error during synchronous game world initialization:", e)
@@ -579,60 +697,102 @@ class Game:
         self.update_camera_shake(dt)
         
         # Update enemies (they handle their own animation and AI)
-        for enemy in self.enemies[:]:
-            await enemy.update(self.player)
+        await self._update_enemies()
+        
+        # Update resources and power-ups
+        self._update_pickups(dt)
+        
+        # Update effects
+        self.effect_pool.update()
+        
+        # Update survival time. dt is a measured perf_counter delta, so the
+        # sum tracks real play time and stays frozen while paused or crafting
+        self.survival_time += dt
+    
+    async def _update_enemies(self):
+        """Run enemy AI and animation, removing and scoring defeated enemies."""
+        player = self.player
+        
+        # Survivors are collected into a new list rather than removing the
+        # dead from a copy, which was quadratic in the enemy count
+        had_enemies = bool(self.enemies)
+        alive = []
+        defeated = []
+        
+        # AI for the whole wave is stepped in one batch, free of coroutine
+        # overhead; only the attacks that came due are awaited
+        attacks = step_enemies(self.enemies, player) if player else [False] * len(self.enemies)
+        for enemy, attack_due in zip(self.enemies, attacks):
+            if attack_due:
+                await enemy.attack_player(player)
             enemy.animate()
             
             # Check if enemy is dead
             if enemy.health <= 0:
-                # Spawn resources from defeated enemy
-                self.spawn_resource_from_enemy(enemy.x, enemy.y)
+                # Drops for everything defeated this frame are rolled together below
+                defeated.append((enemy.x, enemy.y))
                 
-                self.enemies.remove(enemy)
                 # Score calculation: 100 points × wave_number per defeated enemy
                 self.score += 100 * self.wave_number
                 self.add_effect("explosion", enemy.x, enemy.y)
+            else:
+                alive.append(enemy)
+        self.enemies = alive
+        
+        if defeated:
+            self.spawn_resources_from_enemies(defeated)
+        
+        # Wave cleared: schedule the next one instead of polling a timer
+        # every frame until it is due
+        if had_enemies and not alive and self.enemies_to_spawn == 0:
+            self._wave_break_remaining_ms = self.WAVE_DELAY_MS
+            self._wave_break_started = self._now
+            pygame.time.set_timer(self.WAVE_READY_EVENT_ID, self.WAVE_DELAY_MS, loops=1)
+    
+    def _cancel_wave_timer(self):
+        """Drop any pending break between waves."""
+        pygame.time.set_timer(self.WAVE_READY_EVENT_ID, 0)
+        self._wave_break_remaining_ms = None
+        self._wave_break_started = None
+    
+    def _sync_wave_timer(self, running: bool):
+        """
+        Pause or resume the break between waves.
         
-        # Update resources
-        for resource in self.resources[:]:
-            if hasattr(resource, 'update'):
-                resource.update(dt)
-        
-        # Update power-ups
-        for power_up in self.power_ups[:]:
-            if hasattr(power_up, 'update'):
-                power_up.update(dt)
-        
-        # Update effects
-        for effect in self.effects_list[:]:
-            effect['timer'] -= 1
-            if effect['timer'] <= 0:
-                self.effects_list.remove(effect)
-        
-        # Update survival time
-        self.survival_time += dt
+        Args:
+            running: Whether gameplay is advancing this frame; the break is
+                frozen while paused or crafting, as the world update is
+        """
+        if self._wave_break_remaining_ms is None:
+            return
+        if running and self._wave_break_started is None:
+            self._wave_break_started = self._now
+            pygame.time.set_timer(self.WAVE_READY_EVENT_ID,
+                                  max(1, int(self._wave_break_remaining_ms)), loops=1)
+        elif not running and self._wave_break_started is not None:
+            # Keep what is left of the break and stop the timer until resumed
+            self._wave_break_remaining_ms -= (self._now - self._wave_break_started) * 1000
+            self._wave_break_started = None
+            pygame.time.set_timer(self.WAVE_READY_EVENT_ID, 0)
+    
+    def _update_pickups(self, dt):
+        """Animate resources and power-ups lying in the world."""
+        # Pickups share Resource's update/draw interface, so no per-object
+        # capability checks are needed here or in _draw_entities
+        for resource in self.resources:
+            resource.update(dt)
         
-        # Check for wave completion
-        if len(self.enemies) == 0 and self.enemies_to_spawn == 0:
-            self.next_wave_timer += dt
-            if self.next_wave_timer >= 5.0:  # 5 second delay between waves
-                self.start_next_wave()
+        for power_up in self.power_ups:
+            power_up.update(dt)
     
     def start_next_wave(self):
         """Start a new enemy wave with visual and audio effects."""
         self.wave_number += 1
-        self.next_wave_timer = 0
         print(f"Starting wave {self.wave_number}")
         
         # Calculate enemies based on wave and difficulty
         base_enemies = 2 + self.wave_number
-        difficulty_mult = {"Easy": 0.7, "Normal": 1.0, "Hard": 2.0}
-        difficulty_factor = difficulty_mult.get(
-            self.settings_manager.get_setting("difficulty"), 
-            1.0
-        )
-        
-        self.enemies_to_spawn = max(3, int(base_enemies * difficulty_factor))
+        self.enemies_to_spawn = max(3, int(base_enemies * self._difficulty_factor))
         
         # Show wave notification - BIG TEXT ON SCREEN
         self.add_effect(
@@ -646,8 +806,7 @@ class Game:
         )
         
         # Play sound
-        if hasattr(self.effects, 'play_sound'):
-            self.effects.play_sound("level_up")
+        self.effects.play_sound("level_up")
         
         # Start screen shake
         self.start_screen_shake(20, 0.5)
@@ -659,6 +818,13 @@ class Game:
         """Start screen shake effect."""
         self.screen_shake_amount = amount      # How intense (pixels offset)
         self.screen_shake_duration = duration  # How long (seconds)
+        
+        intensity = min(amount, 10)  # Cap at 10 pixels
+        if intensity == 10:
+            self._shake_offsets = self._shake_table
+        else:
+            self._shake_offsets = [(int(x * intensity / 10), int(y * intensity / 10))
+                                   for x, y in self._shake_table]
     
     def update_camera_shake(self, dt):
         """Update screen shake effect."""
@@ -667,10 +833,9 @@ class Game:
             self.screen_shake_duration -= dt
             
             # Calculate offset
-            if self.settings_manager.get_setting("screen_shake"):
-                intensity = min(self.screen_shake_amount, 10)  # Cap at 10 pixels
-                self.camera_offset_x = random.randint(-intensity, intensity)
-                self.camera_offset_y = random.randint(-intensity, intensity)
+            if self._screen_shake_enabled:
+                self.camera_offset_x, self.camera_offset_y = self._shake_offsets[self._shake_index & 255]
+                self._shake_index += 1
             else:
                 self.camera_offset_x = 0
                 self.camera_offset_y = 0
@@ -685,16 +850,7 @@ class Game:
         """Spawn enemies for the current wave."""
         # Load enemy sprite sheet if needed
         if not self.enemy_sprite_sheet:
-            try:
-                import os
-                sprite_path = os.path.join(os.path.dirname(__file__), "spritesheets", "enemy-spritesheet.png")
-                self.enemy_sprite_sheet = pygame.image.load(sprite_path).convert_alpha()
-                print(f"Loaded enemy sprite sheet from {sprite_path}")
-            except Exception as e:
-                print(f"Could not load enemy sprite: {e}")
-                # Create a simple colored surface as fallback
-                self.enemy_sprite_sheet = pygame.Surface((32, 32))
-                self.enemy_sprite_sheet.fill(NEON_RED)
+            self.enemy_sprite_sheet = self._load_sprite_sheet(ENEMY_SHEET_PATH, "enemy", NEON_RED)
         
         # Calculate number of enemies based on wave
         num_enemies = 3 + (self.wave_number * 2)
@@ -702,26 +858,19 @@ class Game:
         # Get server URL from auth manager
         server_url = self.auth_manager.get_server_url()
         
-        # Spawn enemies at random positions around the map edges
-        for i in range(num_enemies):
-            # Random spawn position (edge of map)
-            side = random.randint(0, 3)  # 0=top, 1=right, 2=bottom, 3=left
-            
-            if side == 0:  # Top
-                x = random.randint(0, WIDTH)
-                y = 0
-            elif side == 1:  # Right
-                x = WIDTH
-                y = random.randint(0, HEIGHT)
-            elif side == 2:  # Bottom
-                x = random.randint(0, WIDTH)
-                y = HEIGHT
-            else:  # Left
-                x = 0
-                y = random.randint(0, HEIGHT)
-            
+        # Spawn enemies at random positions around the map edges, drawing
+        # the whole wave's sides and coordinates at once
+        rng = self._rng
+        sides = rng.integers(0, 4, size=num_enemies)  # 0=top, 1=right, 2=bottom, 3=left
+        xs = rng.integers(0, WIDTH, size=num_enemies, endpoint=True)
+        ys = rng.integers(0, HEIGHT, size=num_enemies, endpoint=True)
+        xs = np.where(sides == 1, WIDTH, np.where(sides == 3, 0, xs))
+        ys = np.where(sides == 0, 0, np.where(sides == 2, HEIGHT, ys))
+        
+        for x, y in zip(xs.tolist(), ys.tolist()):
             # Create enemy with sprite sheet and server URL
-            enemy = Enemy(self.enemy_sprite_sheet, x, y, server_url)
+            enemy = Enemy(self.enemy_sprite_sheet, x, y, server_url,
+                          action_queue=self._action_queue)
             
             # Scale enemy health based on wave number for progressive difficulty
             # Base health: 50, increases by 20 per wave
@@ -740,67 +889,86 @@ class Game:
     def spawn_initial_resources(self):
         """Spawn initial resources randomly across the map."""
         # Number of each resource type to spawn initially
+        rng = self._rng
         resource_counts = {
-            "code_fragments": random.randint(8, 12),
-            "energy_cores": random.randint(5, 8),
-            "data_shards": random.randint(3, 6)
+            "code_fragments": int(rng.integers(8, 12, endpoint=True)),
+            "energy_cores": int(rng.integers(5, 8, endpoint=True)),
+            "data_shards": int(rng.integers(3, 6, endpoint=True))
         }
+        total = sum(resource_counts.values())
+        
+        # Positions (padded from the edges) and amounts (1-3) for every
+        # resource are drawn in one call each
+        xs = rng.integers(100, WIDTH - 100, size=total, endpoint=True).tolist()
+        ys = rng.integers(100, HEIGHT - 100, size=total, endpoint=True).tolist()
+        amounts = rng.integers(1, 3, size=total, endpoint=True).tolist()
         
+        i = 0
         for resource_type, count in resource_counts.items():
+            # Get sprite for this resource type
+            sprite = self.resource_sprites.get(resource_type, None)
+            
             for _ in range(count):
-                # Random position with some padding from edges
-                x = random.randint(100, WIDTH - 100)
-                y = random.randint(100, HEIGHT - 100)
-                
-                # Random amount (1-3)
-                amount = random.randint(1, 3)
-                
-                # Get sprite for this resource type
-                sprite = self.resource_sprites.get(resource_type, None)
-                
                 # Create resource with sprite
-                resource = Resource(x, y, resource_type, amount, sprite)
+                resource = self._acquire_resource(xs[i], ys[i], resource_type, amounts[i], sprite)
                 self.resources.append(resource)
+                i += 1
         
-        print(f"Spawned initial resources: {sum(resource_counts.values())} total")
+        print(f"Spawned initial resources: {total} total")
+    
+    def _acquire_resource(self, x, y, resource_type, amount, sprite):
+        """Return a Resource for a new drop, reusing a collected one when available."""
+        if self._resource_pool:
+            resource = self._resource_pool.pop()
+            resource.reset(x, y, resource_type, amount, sprite)
+            return resource
+        return Resource(x, y, resource_type, amount, sprite)
+    
+    def _release_resources(self, resources):
+        """Return resources that left the world to the pool, up to RESOURCE_POOL_SIZE."""
+        pool = self._resource_pool
+        room = RESOURCE_POOL_SIZE - len(pool)
+        if room > 0:
+            pool.extend(resources[:room])
     
     def spawn_resource_from_enemy(self, enemy_x, enemy_y):
         """Spawn resources when an enemy is defeated."""
-        # Chance to drop resources (80% chance)
-        if random.random() < 0.8:
-            # Determine what to drop
-            drop_chances = {
-                "code_fragments": 0.5,   # 50% chance
-                "energy_cores": 0.3,     # 30% chance
-                "data_shards": 0.2       # 20% chance
-            }
-            
-            # Randomly select resource type based on weights
-            resource_type = random.choices(
-                list(drop_chances.keys()),
-                weights=list(drop_chances.values()),
-                k=1
-            )[0]
+        self.spawn_resources_from_enemies([(enemy_x, enemy_y)])
+    
+    def spawn_resources_from_enemies(self, positions):
+        """Spawn resource drops for every enemy defeated this frame.
+        
+        Args:
+            positions: (x, y) world positions of the defeated enemies
+        """
+        # Every random value for the burst is drawn up front, one call per kind
+        rng = self._rng
+        count = len(positions)
+        drops = (rng.random(count) < RESOURCE_DROP_CHANCE).tolist()
+        type_indices = np.searchsorted(RESOURCE_DROP_CUM_WEIGHTS, rng.random(count), side="right").tolist()
+        amounts = rng.integers(1, 2, size=count, endpoint=True).tolist()
+        offsets = rng.integers(-20, 20, size=(count, 2), endpoint=True).tolist()
+        
+        for i, (enemy_x, enemy_y) in enumerate(positions):
+            if not drops[i]:
+                continue
+            resource_type = RESOURCE_DROP_TYPES[type_indices[i]]
             
             # Random amount (1-2 for common, 1 for rare)
-            if resource_type == "data_shards":
-                amount = 1
-            else:
-                amount = random.randint(1, 2)
+            amount = 1 if resource_type == "data_shards" else amounts[i]
             
             # Spawn near enemy position with slight random offset
-            offset_x = random.randint(-20, 20)
-            offset_y = random.randint(-20, 20)
+            offset_x, offset_y = offsets[i]
             
             # Get sprite for this resource type
             sprite = self.resource_sprites.get(resource_type, None)
             
-            resource = Resource(enemy_x + offset_x, enemy_y + offset_y, resource_type, amount, sprite)
+            resource = self._acquire_resource(enemy_x + offset_x, enemy_y + offset_y, resource_type, amount, sprite)
             self.resources.append(resource)
             
             # Visual feedback
             self.add_effect("text", enemy_x, enemy_y - 30,
-                          text=f"+{amount} {resource_type.replace('_', ' ').title()}",
+                          text=f"+{amount} {RESOURCE_LABELS[resource_type]}",
                           color=resource.base_color,
                           size=16,
                           duration=1.5)
@@ -814,89 +982,154 @@ class Game:
             # Fallback if world not initialized yet
             self.screen.fill(BG_COLOR)
         
-        # Draw resources
-        for resource in self.resources:
-            if hasattr(resource, 'draw'):
-                resource.draw(self.screen, self.camera_system)
-        
-        # Draw power-ups
-        for power_up in self.power_ups:
-            if hasattr(power_up, 'draw'):
-                power_up.draw(self.screen, self.camera_system)
-        
-        # Draw enemies (they handle their own drawing)
-        for enemy in self.enemies:
-            enemy.draw(self.screen, self.camera_system)
+        # Draw resources, power-ups and enemies
+        self._draw_entities()
         
         # Draw player (handles own drawing including projectiles)
         if self.player:
             self.player.draw(self.screen, self.camera_system)
-            if hasattr(self.player, 'draw_projectiles'):
-                self.player.draw_projectiles(self.screen, self.camera_system)
+            self.player.draw_projectiles(self.screen, self.camera_system)
         
         # Draw other players (multiplayer)
+        render_t = self._now - self.REMOTE_INTERP_DELAY
         for player_id, player_data in self.other_players.items():
-            # Draw other players
-            pass
+            sprite = player_data.get("sprite")
+            pos = self._remote_player_position(player_data, render_t)
+            if sprite is not None and pos is not None:
+                self.screen.blit(sprite, self.camera_system.world_to_screen(*pos))
+        
+        # Draw effects; explosion circles and text each go out in one
+        # blits() call, circles first so text stays on top
+        shape_blits = []
+        text_blits = []
+        for effect_type, x, y, screen_x, screen_y, timer, params in self.effect_pool.active_on_screen(
+                self.camera_system, self.camera_offset_x, self.camera_offset_y):
+            self.draw_effect(effect_type, x, y, screen_x, screen_y, timer, params, text_blits, shape_blits)
+        self.screen.blits(shape_blits, doreturn=False)
+        self.screen.blits(text_blits, doreturn=False)
+    
+    def _draw_entities(self):
+        """Draw world entities in back-to-front order."""
+        # Bound once; these loops run for every entity every frame
+        screen = self.screen
+        camera = self.camera_system
+        
+        # Resource glows are drawn as each resource is visited and their
+        # sprites follow in one blits() call, so every glow sits underneath
+        resource_blits = []
+        for resource in self.resources:
+            resource.add_blits(screen, resource_blits, camera)
+        screen.blits(resource_blits, doreturn=False)
         
-        # Draw effects
-        for effect in self.effects_list:
-            self.draw_effect(effect)
+        for power_up in self.power_ups:
+            power_up.draw(screen, camera)
+        
+        # Enemy sprites and health bars go out in a single blits() call,
+        # in the same order the per-enemy draw() calls used
+        enemy_blits = []
+        for enemy in self.enemies:
+            enemy.add_blits(enemy_blits, camera)
+        screen.blits(enemy_blits, doreturn=False)
     
-    def draw_effect(self, effect):
-        """Draw a visual effect."""
-        effect_type = effect.get('type')
-        x, y = effect.get('x'), effect.get('y')
+    def draw_effect(self, effect_type, x, y, screen_x, screen_y, timer, params, blits, shape_blits):
+        """Queue a visual effect at its world (x, y) or precomputed screen position.
         
+        Text surfaces are appended to ``blits`` and explosion circles to
+        ``shape_blits`` as (surface, dest) pairs for the caller to draw in
+        batches.
+        """
         if effect_type == 'text':
-            text = effect.get('text', '')
-            color = effect.get('color', WHITE)
-            size = effect.get('size', 20)
-            font = pygame.font.Font(None, size)
-            text_surf = font.render(text, True, color)
+            text_surf = params.surf
             
             # For large screen-centered text (like wave announcements), don't apply camera offset
-            if size >= 60:
+            if params.size >= 60:
                 # Center the text on screen with screen shake offset
                 text_rect = text_surf.get_rect(center=(x + self.camera_offset_x, y + self.camera_offset_y))
-                self.screen.blit(text_surf, text_rect)
+                blits.append((text_surf, text_rect))
             else:
-                # Apply camera offset for world-space text
-                screen_pos = self.camera_system.world_to_screen(x, y)
-                self.screen.blit(text_surf, (screen_pos[0] + self.camera_offset_x, 
-                                            screen_pos[1] + self.camera_offset_y))
+                # World-space text; screen_x/screen_y include the camera shake
+                blits.append((text_surf, (screen_x, screen_y)))
         
         elif effect_type == 'explosion':
             # Draw explosion effect with screen shake
-            radius = int(20 - (effect['timer'] / 3))
+            radius = int(20 - (timer / 3))
             if radius > 0:
-                screen_pos = self.camera_system.world_to_screen(x, y)
-                pygame.draw.circle(self.screen, YELLOW, 
-                                 (int(screen_pos[0] + self.camera_offset_x), 
-                                  int(screen_pos[1] + self.camera_offset_y)), 
-                                 radius)
+                shape_blits.append((get_circle_surface(YELLOW, radius),
+                                    (int(screen_x) - radius, int(screen_y) - radius)))
     
     # ==================== RESOURCE SHARING ====================
     # Resource sharing feature removed
     
     # ==================== MULTIPLAYER ====================
     
-    async def send_position_update(self):
-        """Send position update to server."""
-        if not self.websocket or not self.player:
-            return
-        
-        try:
-            update = {
-                "type": "position_update",
-                "player_id": self.session_id,
-                "x": self.player.x,
-                "y": self.player.y,
-                "sprite": self.player.current_sprite_index if hasattr(self.player, 'current_sprite_index') else 0
+    async def _action_worker(self):
+        """Await queued coroutine functions one after another."""
+        while True:
+            action = await self._action_queue.get()
+            try:
+                await action()
+            except Exception as e:
+                print(f"Error running queued action: {e}")
+    
+    def record_remote_position(self, username, x, y, direction=None, sprite=None):
+        """Store a position sample received from the server for another player."""
+        player_data = self.other_players.get(username)
+        if player_data is None:
+            player_data = self.other_players[username] = {
+                "x": x,
+                "y": y,
+                "direction": direction or "down",
+                "sprite": sprite
             }
-            await self.websocket.send(json.dumps(update))
-        except Exception as e:
-            print(f"Error sending position update: {e}")
+        samples = player_data.setdefault("samples", deque(maxlen=8))
+        
+        # Velocity from the last two samples, used when the next one is late.
+        # Samples arrive between frames, so they are stamped on arrival using
+        # the same clock as the frame time they are interpolated against
+        now = time.perf_counter()
+        if samples:
+            last_t, last_x, last_y = samples[-1]
+            if now > last_t:
+                player_data["vx"] = (x - last_x) / (now - last_t)
+                player_data["vy"] = (y - last_y) / (now - last_t)
+        samples.append((now, x, y))
+        
+        player_data["x"] = x
+        player_data["y"] = y
+        if direction:
+            player_data["direction"] = direction
+        player_data["last_update"] = pygame.time.get_ticks()
+    
+    def _remote_player_position(self, player_data, render_t):
+        """Interpolate a remote player's position at render_t, or None before any sample."""
+        samples = player_data.get("samples")
+        if not samples:
+            return None
+        
+        newest_t, newest_x, newest_y = samples[-1]
+        if render_t >= newest_t:
+            # No newer sample yet; keep moving along the last known velocity.
+            # A player who stopped sends nothing more, so once the limit is
+            # passed glide back onto the newest sample and hold it there
+            limit = self.REMOTE_EXTRAPOLATE_LIMIT
+            elapsed = render_t - newest_t
+            ahead = elapsed if elapsed <= limit else max(0.0, 2 * limit - elapsed)
+            return (newest_x + player_data.get("vx", 0.0) * ahead,
+                    newest_y + player_data.get("vy", 0.0) * ahead)
+        
+        # Walk back to the pair of samples straddling render_t
+        later = samples[-1]
+        for i in range(len(samples) - 2, -1, -1):
+            earlier = samples[i]
+            if earlier[0] <= render_t:
+                span = later[0] - earlier[0]
+                alpha = (render_t - earlier[0]) / span if span > 0 else 1.0
+                return (earlier[1] + (later[1] - earlier[1]) * alpha,
+                        earlier[2] + (later[2] - earlier[2]) * alpha)
+            later = earlier
+        
+        # render_t predates the buffer; hold the oldest sample
+        return (later[1], later[2])
     
     # ==================== GAME RESTART ====================
     
@@ -907,7 +1140,7 @@ class Game:
         self.enemies = []
         self.resources = []
         self.power_ups = []
-        self.effects_list = []
+        self.effect_pool.clear()
         self.score = 0
         self.survival_time = 0
         self.wave_number = 0
@@ -940,7 +1173,7 @@ class Game:
             self.enemies = []
             self.resources = []
             self.power_ups = []
-            self.effects_list = []
+            self.effect_pool.clear()
             self.score = 0
             self.survival_time = 0
             self.wave_number = 0
@@ -966,7 +1199,7 @@ class Game:
         self.enemies = []
         self.resources = []
         self.power_ups = []
-        self.effects_list = []
+        self.effect_pool.clear()
         self.score = 0
         self.survival_time = 0
         self.wave_number = 0
@@ -1002,32 +1235,101 @@ class Game:
         """
         pass
     
+    def present_frame(self, render_state: str, had_input: bool):
+        """Push the frame to the display, updating only dirty rects on unchanged static screens."""
+        present_key = (render_state, self.current_width, self.current_height)
+        full = (
+            render_state not in self.PARTIAL_UPDATE_STATES
+            or present_key != self._presented_key
+            or had_input
+            or self.state_manager.screen_rebuilt
+            or self.state_manager.is_transitioning()
+            or self.ui_manager.has_live_widget()
+        )
+        
+        if full:
+            pygame.display.flip()
+        elif self.ui_manager.dirty_rects:
+            # A few small rects are far cheaper to push than the whole window
+            pygame.display.update(self.ui_manager.dirty_rects)
+        
+        self.ui_manager.dirty_rects.clear()
+        self.state_manager.screen_rebuilt = False
+        self._presented_key = present_key
+    
     # ==================== MAIN GAME LOOP ====================
     
+    async def wait_for_next_frame(self, frame_start: float, frame_target: float):
+        """Sleep out the rest of the frame budget, yielding to background tasks."""
+        remaining = frame_target - (time.perf_counter() - frame_start)
+        
+        # Sleeping on the event loop lets the action worker and websocket
+        # sender run; the last millisecond is spun for accurate timing
+        if remaining > 0.002:
+            await asyncio.sleep(remaining - 0.001)
+        else:
+            await asyncio.sleep(0)
+        while time.perf_counter() - frame_start < frame_target:
+            pass
+    
+    def _on_quit(self, events):
+        """Stop the main loop after the current frame."""
+        self._running = False
+    
+    def _on_wave_ready(self, events):
+        """Start the next wave once its delay timer fires."""
+        # An event queued just before the break was frozen is ignored; the
+        # timer is re-armed with the remaining time on resume
+        if self._wave_break_started is None:
+            return
+        self._wave_break_remaining_ms = None
+        self._wave_break_started = None
+        if self.player:
+            self.start_next_wave()
+    
+    def _on_resize(self, events):
+        """Recreate the display and re-lay out the UI for a resized window."""
+        for event in events:
+            self.current_width = event.w
+            self.current_height = event.h
+            self.screen = self.set_display_mode((self.current_width, self.current_height))
+            self.ui_manager.update_positions(
+                self.current_width, 
+                self.current_height
+            )
+            self.state_manager.invalidate_cached_backgrounds()
+    
     async def run(self):
         """Main game loop."""
-        running = True
+        self._running = True
+        
+        # Events grouped by type, reused every frame; handlers only walk
+        # the buckets they care about instead of rescanning every event
+        buckets = defaultdict(list)
+        
+        self._action_worker_task = asyncio.create_task(self._action_worker())
         
-        while running:
-            dt = self.clock.tick(self.FPS) / 1000.0  # Delta time in seconds
-            events = pygame.event.get()
+        frame_target = 1 / self.FPS
+        last_frame = time.perf_counter()
+        
+        while self._running:
+            frame_start = self._now = time.perf_counter()
+            dt = frame_start - last_frame  # Delta time in seconds
+            last_frame = frame_start
             mouse_pos = pygame.mouse.get_pos()
             
+            buckets.clear()
+            for event in pygame.event.get():
+                buckets[event.type].append(event)
+            
             # Handle window events
-            for event in events:
-                if event.type == pygame.QUIT:
-                    running = False
-                elif event.type == pygame.VIDEORESIZE:
-                    self.current_width = event.w
-                    self.current_height = event.h
-                    self.screen = pygame.display.set_mode(
-                        (self.current_width, self.current_height), 
-                        pygame.RESIZABLE
-                    )
-                    self.ui_manager.update_positions(
-                        self.current_width, 
-                        self.current_height
-                    )
+            for event_type, on_events in self._window_event_handlers.items():
+                events = buckets.get(event_type)
+                if events:
+                    on_events(events)
+            
+            # Menu-style screens only react to mouse clicks
+            ui_events = buckets[pygame.MOUSEBUTTONDOWN] + buckets[pygame.MOUSEBUTTONUP]
             
             # Update state transitions
             self.state_manager.update_transition()
@@ -1042,24 +1344,24 @@ class Game:
             else:
                 render_state = current_state
             
-            if render_state == "menu":
-                await self.state_manager.handle_menu_state(events, mouse_pos)
-            elif render_state == "gameplay":
-                await self.handle_gameplay_state(events, dt)
-            elif render_state == "pause":
-                await self.state_manager.handle_pause_state(events, mouse_pos)
-            elif render_state == "game_over":
-                await self.state_manager.handle_game_over_state(events, mouse_pos)
-            elif render_state == "leaderboard":
-                await self.state_manager.handle_leaderboard_state(events, mouse_pos)
-            elif render_state == "settings":
-                await self.state_manager.handle_settings_state(events, mouse_pos)
+            handler = self._state_handlers.get(render_state)
+            if handler:
+                await handler(ui_events, mouse_pos, dt, buckets)
+            
+            # The wave break only counts down while gameplay is advancing
+            self._sync_wave_timer(
+                self.state_manager.get_state() == "gameplay"
+                and not self.state_manager.is_transitioning()
+                and not self.crafting_system.is_menu_open()
+            )
             
             # Draw fade overlay if transitioning
             if self.state_manager.is_transitioning():
                 self.state_manager.draw_fade_overlay()
             
-            pygame.display.flip()
+            self.present_frame(render_state, bool(ui_events))
+            
+            await self.wait_for_next_frame(frame_start, frame_target)
         
         pygame.quit()
         sys.exit()
@@ -8,6 +8,7 @@ import requests
 import json
 import time
 import os
+import itertools
 from typing import List, Dict, Optional
 from datetime import datetime
 
@@ -19,6 +20,7 @@ class LeaderboardManager:
         self.server_url = server_url
         self.auth_headers = auth_headers or {}
         self.entries: List[Dict] = []
+        self.entries_version: int = 0  # Bumped whenever entries is replaced
         self.last_update: float = 0
         self.update_interval: float = 60  # Update every 60 seconds
         self.max_entries: int = 10
@@ -28,6 +30,10 @@ class LeaderboardManager:
         self.username: Optional[str] = None
         self.current_game_id: Optional[str] = None  # Track current game session
         self.view_mode: str = "global"  # "global" or "game"
+        # Fetches run on worker threads and can overlap; each takes the next
+        # number and only the newest one started may publish its result
+        self._fetch_counter = itertools.count(1)
+        self._latest_fetch: int = 0
         
         # Load authentication from config if available
         self._load_auth_config()
@@ -70,6 +76,8 @@ class LeaderboardManager:
         if not force and (current_time - self.last_update < 2):
             return False
         
+        # next() on a count is atomic, so overlapping threads never share a number
+        generation = self._latest_fetch = next(self._fetch_counter)
         self.loading = True
         self.error_message = None
         
@@ -100,14 +108,20 @@ class LeaderboardManager:
             print(f"DEBUG: Leaderboard fetch response: {response.status_code}")
             print(f"DEBUG: Response body: {response.text[:500]}")  # First 500 chars
             
+            if generation != self._latest_fetch:
+                # A newer fetch (e.g. after a view mode change) owns the
+                # entries now; don't overwrite them with this older result
+                return False
+            
             if response.status_code == 200:
                 data = response.json()
                 server_entries = data.get("leaderboard", [])
                 
-                # Convert server data to standardized format
-                self.entries = []
+                # Convert server data to standardized format; built locally and
+                # assigned once so the screen never sees a half-filled list
+                entries = []
                 for entry in server_entries:
-                    self.entries.append({
+                    entries.append({
                         "name": entry.get("username", "Unknown"),
                         "score": entry.get("score", 0),
                         "time": entry.get("survival_time", entry.get("time", 0)),
@@ -117,10 +131,11 @@ class LeaderboardManager:
                     })
                 
                 # Sort by score (descending)
-                self.entries.sort(key=lambda x: x.get("score", 0), reverse=True)
+                entries.sort(key=lambda x: x.get("score", 0), reverse=True)
                 
                 # Keep only top entries
-                self.entries = self.entries[:self.max_entries]
+                self.entries = entries[:self.max_entries]
+                self.entries_version += 1
                 self.last_update = current_time
                 
                 print(f"Leaderboard updated: {len(self.entries)} entries")
@@ -132,12 +147,14 @@ class LeaderboardManager:
                 return False
                 
         except requests.exceptions.Timeout:
-            self.error_message = "Leaderboard fetch timed out"
-            self.loading = False
+            if generation == self._latest_fetch:
+                self.error_message = "Leaderboard fetch timed out"
+                self.loading = False
             return False
         except Exception as e:
-            self.error_message = f"Error fetching leaderboard: {str(e)}"
-            self.loading = False
+            if generation == self._latest_fetch:
+                self.error_message = f"Error fetching leaderboard: {str(e)}"
+                self.loading = False
             return False
     
     def get_entries(self) -> List[Dict]:
@@ -221,6 +238,7 @@ class LeaderboardManager:
     def clear_cache(self):
         """Clear cached leaderboard data."""
         self.entries = []
+        self.entries_version += 1
         self.last_update = 0
     
     def update_auth_headers(self, headers: Dict[str, str]):
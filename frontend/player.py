@@ -4,9 +4,16 @@ import requests
 import asyncio
 import websockets
 import json
+import orjson
 from effects import GameEffects
 
 class Player:
+    # Movement is sent by position_sender at this rate rather than every frame
+    POSITION_SEND_INTERVAL = 1 / 15
+    
+    # Shared by every player; created by _get_effect_label_font once fonts are initialized
+    _effect_label_font = None
+    
     def __init__(self, sprite_sheet, x, y, speed=5):
         """Initialize the player."""
         # Position and movement
@@ -70,6 +77,7 @@ class Player:
         self.ws = None
         self.connected = False
         self.pending_init = True
+        self.position_task = None
         
         # Equipment
         self.equipped_weapon = None
@@ -279,6 +287,13 @@ class Player:
                           (radius + 5, radius + 5), radius, 3)
         surface.blit(shield_surf, (center_x - radius - 5, center_y - radius - 5))
     
+    @classmethod
+    def _get_effect_label_font(cls) -> pygame.font.Font:
+        """Return the small effect-bar label font, creating it on first use."""
+        if cls._effect_label_font is None:
+            cls._effect_label_font = pygame.font.Font(None, 14)
+        return cls._effect_label_font
+    
     def draw_item_effect_bars(self, surface, screen_x, screen_y):
         """Draw progress bars for active item effects."""
         if not self.active_item_effects:
@@ -312,7 +327,7 @@ class Player:
             
             # Draw effect name label (small font)
             try:
-                font = pygame.font.Font(None, 14)
+                font = self._get_effect_label_font()
                 label = font.render(effect["name"], True, effect["color"])
                 label_rect = label.get_rect(centerx=bar_x + bar_width // 2, bottom=bar_y - 2)
                 surface.blit(label, label_rect)
@@ -383,18 +398,15 @@ class Player:
     
     def check_resource_collision(self, resources):
         """Check collision with resources and collect them."""
-        player_rect = self.get_rect()
+        # One C-level pass over every resource's cached rect instead of a
+        # get_rect()/colliderect() round trip per resource
+        hits = self.get_rect().collidelistall(resources)
         collected = []
         
-        for resource in resources:
-            if hasattr(resource, 'get_rect'):
-                resource_rect = resource.get_rect()
-                if player_rect.colliderect(resource_rect):
-                    # Collect the resource
-                    resource_type = resource.type if hasattr(resource, 'type') else "code_fragments"
-                    amount = resource.amount if hasattr(resource, 'amount') else 1
-                    self.collect_resource(resource_type, amount)
-                    collected.append(resource)
+        for index in hits:
+            resource = resources[index]
+            self.collect_resource(resource.type, resource.amount)
+            collected.append(resource)
         
         return collected
     
@@ -440,7 +452,7 @@ class Player:
         try:
             url = f"{self.server_url}/register/user"
             data = {"username": username, "password": password}
-            response = requests.post(url, json=data)
+            response = await asyncio.to_thread(requests.post, url, json=data)
         
             if response.status_code == 200:
                 print(f"Successfully registered user: {username}")
@@ -459,7 +471,7 @@ class Player:
         try:
             url = f"{self.server_url}/token"
             data = {"username": username, "password": password}
-            response = requests.post(url, data=data)
+            response = await asyncio.to_thread(requests.post, url, data=data)
         
             if response.status_code == 200:
                 token_data = response.json()
@@ -498,6 +510,7 @@ class Player:
         
             self.listener_task = asyncio.create_task(self.listen_for_server_messages())
             self.refresh_task = asyncio.create_task(self.periodic_refresh())
+            self.position_task = asyncio.create_task(self.position_sender())
             
         except Exception as e:
             self.connected = False
@@ -526,6 +539,27 @@ class Player:
             if self.connected:
                 self.connected = False
 
+    async def position_sender(self):
+        """Send the player's position at a fixed rate while it keeps changing"""
+        last_sent = None
+        
+        try:
+            while self.connected and self.ws:
+                await asyncio.sleep(self.POSITION_SEND_INTERVAL)
+                
+                # Only the latest position matters; a standing player sends
+                # nothing, and the final resting position still goes out
+                state = (self.x, self.y, self.direction)
+                if state == last_sent:
+                    continue
+                try:
+                    await self.send_update()
+                    last_sent = state
+                except Exception as e:
+                    print(f"Failed to send position update: {e}")
+        except asyncio.CancelledError:
+            pass
+
     async def end_game_session(self, session_id, score, enemies_defeated, waves_completed):
         """End the current game session with stats"""
         if not hasattr(self, 'auth_token'):
@@ -539,7 +573,7 @@ class Player:
                 "enemies_defeated": enemies_defeated,
                 "waves_completed": waves_completed
             }
-            response = requests.put(url, json=data, headers=headers)
+            response = await asyncio.to_thread(requests.put, url, json=data, headers=headers)
         
             if response.status_code == 200:
                 print("Successfully ended game session")
@@ -598,6 +632,7 @@ class Player:
             print(f"Connected to WebSocket as {self.username}")
             
             self.listener_task = asyncio.create_task(self.listen_for_server_messages())
+            self.position_task = asyncio.create_task(self.position_sender())
         except Exception as e:
             self.connected = False
             print(f"Failed to connect to WebSocket: {e}")
@@ -612,6 +647,9 @@ class Player:
                 await asyncio.sleep(0.1)
             except Exception as e:
                 print(f"Error cancelling refresh task: {e}")
+        
+        if self.position_task:
+            self.position_task.cancel()
                 
         if hasattr(self, 'ws') and self.ws:
             try:
@@ -659,7 +697,7 @@ class Player:
                         "sprite": self.idle
                     }
                 if hasattr(self, "game_ref") and hasattr(self.game_ref, "chat_system"):
-                    if self.game_ref and hasattr(self.game_ref, "chat_system"):
+                    if self.game_ref and self.game_ref.chat_system:
                         self.game_ref.chat_system.add_message("", f"{joined_username} joined the game", system_message=True)
     
         elif event_type == "player_left":
@@ -695,51 +733,26 @@ class Player:
             
             if username != self.username and position:
                 if hasattr(self, "game_ref") and self.game_ref:
-                    if not hasattr(self.game_ref, "other_players"):
-                        self.game_ref.other_players = {}
-                        
-                    if username not in self.game_ref.other_players:
-                        self.game_ref.other_players[username] = {
-                            "x": position["x"],
-                            "y": position["y"],
-                            "direction": direction,
-                            "last_update": pygame.time.get_ticks(),
-                            "sprite": self.idle
-                        }
-                    else:
-                        self.game_ref.other_players[username]["x"] = position["x"]
-                        self.game_ref.other_players[username]["y"] = position["y"]
-                        self.game_ref.other_players[username]["direction"] = direction
-                        self.game_ref.other_players[username]["last_update"] = pygame.time.get_ticks()
-                        self.game_ref.other_players[username]["prev_x"] = position["x"]
-                        self.game_ref.other_players[username]["prev_y"] = position["y"]
+                    # Samples are buffered so the game can interpolate between them
+                    self.game_ref.record_remote_position(
+                        username, position["x"], position["y"], direction, self.idle
+                    )
 
         elif event_type == "all_players":
             players_list = data.get("players", [])
             print(f"Received list of {len(players_list)} players from server")
             
             if hasattr(self, "game_ref") and self.game_ref:
-                if not hasattr(self.game_ref, "other_players"):
-                    self.game_ref.other_players = {}
-                
                 for player_data in players_list:
                     player_username = player_data.get("username")
                     
                     if player_username == self.username:
                         continue
-                        
-                    if player_username not in self.game_ref.other_players:
-                        self.game_ref.other_players[player_username] = {
-                            "x": player_data.get("x", 0),
-                            "y": player_data.get("y", 0),
-                            "direction": "down",
-                            "last_update": pygame.time.get_ticks(),
-                            "sprite": self.idle
-                        }
-                    else:
-                        self.game_ref.other_players[player_username]["x"] = player_data.get("x", 0)
-                        self.game_ref.other_players[player_username]["y"] = player_data.get("y", 0)
-                        self.game_ref.other_players[player_username]["last_update"] = pygame.time.get_ticks()
+                    
+                    self.game_ref.record_remote_position(
+                        player_username, player_data.get("x", 0), player_data.get("y", 0),
+                        sprite=self.idle
+                    )
 
     async def send_update(self):
         """Sends updated player data to the server"""
@@ -752,7 +765,9 @@ class Player:
                 "inventory": self.resources,  # Use resources instead of inventory
                 "direction": self.direction
             }
-            await self.ws.send(json.dumps(update_data))
+            # Sent up to 15 times a second by position_sender; orjson is far
+            # cheaper than json.dumps, decoded since the server reads text
+            await self.ws.send(orjson.dumps(update_data).decode())
 
     def load_animations(self, sheet):
         """Load all animation frames from sprite sheet."""
@@ -776,7 +791,7 @@ class Player:
                 self.idle = sheet
         except Exception as e:
             print(f"Error loading animations: {e}")
-            fallback = pygame.Surface((self.sprite_width, self.sprite_height), pygame.SRCALPHA)
+            fallback = pygame.Surface((self.sprite_width, self.sprite_height), pygame.SRCALPHA).convert_alpha()
             fallback.fill((255, 0, 255))
             self.walk_right = [fallback] * 4
             self.walk_left = [fallback] * 4
@@ -839,9 +854,8 @@ class Player:
                     moving = False
                     return moving
         
-        if moving:
-            await self.send_update()
-            
+        # No send here; position_sender pushes the latest position at a
+        # fixed rate instead of one message per moving frame
         return moving
 
     async def animate(self, moving, keys, enemies):
@@ -934,7 +948,8 @@ class Player:
         
         # Update each projectile
         projectile_hit = False  # Initialize projectile_hit
-        for projectile in self.projectiles[:]:
+        remaining = []  # Projectiles still in flight after this frame
+        for projectile in self.projectiles:
             # Move projectile
             if projectile["dir"] == "right":
                 projectile["x"] += self.projectile_speed
@@ -951,17 +966,17 @@ class Player:
                 projectile["y"] < 0 or
                 projectile["y"] > screen_height):
                 # Remove projectile
-                self.projectiles.remove(projectile)
                 continue
             
             # Check collisions with enemies
-            for enemy in enemies[:]:
+            for enemy in enemies:
                 if enemy.collides_with(projectile):
                     # Remove projectile
-                    if projectile in self.projectiles:
-                        self.projectiles.remove(projectile)
                     projectile_hit = True  # Set projectile_hit to True
                     break
+            else:
+                remaining.append(projectile)
+        self.projectiles = remaining
         
         # If a projectile hit something, we'll update the server
         if projectile_hit:
@@ -1184,18 +1199,21 @@ class Player:
     
     def update_active_item_effects(self):
         """Update active item effect durations and remove expired ones."""
-        for effect in self.active_item_effects[:]:
+        remaining = []
+        for effect in self.active_item_effects:
             # Handle shield type specially - update duration based on current shield
             if effect.get("type") == "shield":
                 effect["duration"] = self.shield
                 # Remove shield indicator when shield is depleted
                 if self.shield <= 0:
-                    self.active_item_effects.remove(effect)
+                    continue
             else:
                 # Handle time-based effects
                 effect["duration"] -= 1
                 if effect["duration"] <= 0:
-                    self.active_item_effects.remove(effect)
+                    continue
+            remaining.append(effect)
+        self.active_item_effects = remaining
 
     def update_energy(self, dt):
         """Update player energy regeneration."""
@@ -2,6 +2,7 @@
 """
 State Manager for handling game state transitions and state-related logic.
 """
+import asyncio
 import pygame
 import random
 from typing import Optional, Callable, TYPE_CHECKING
@@ -47,6 +48,24 @@ class StateManager:
         # Menu background and particles
         self.menu_background = None
         self.data_particles = []
+        
+        # Pre-rendered static parts of each screen, dropped on resize
+        self._menu_grid = None
+        self._menu_text = None
+        self._leaderboard_bg = None
+        self._leaderboard_bg_key = None
+        self._settings_bg = None
+        # Set when a cached screen changes content mid-state
+        self.screen_rebuilt = False
+        
+        # Leaderboard HTTP calls run on worker threads; held so they are not
+        # garbage collected mid-flight and so fetches are not stacked up
+        self._leaderboard_fetch: Optional[asyncio.Task] = None
+        self._score_submit: Optional[asyncio.Task] = None
+        
+        # Full-screen black overlays reused across frames
+        self._pause_overlay = None
+        self._fade_overlay = None
     
     def set_game_instance(self, game: 'Game'):
         """Set reference to game instance for state handlers."""
@@ -58,7 +77,7 @@ class StateManager:
     def initialize_menu_background(self, width, height):
         """Initialize the cyberpunk menu background and data particles."""
         # Create background surface
-        self.menu_background = pygame.Surface((width, height))
+        self.menu_background = pygame.Surface((width, height)).convert()
         self.generate_cyberpunk_background(width, height)
         
         # Create data particles
@@ -115,6 +134,25 @@ class StateManager:
                         color = NEON_GREEN
                     pygame.draw.circle(self.menu_background, color, (x, y), size)
     
+    def invalidate_cached_backgrounds(self):
+        """Drop pre-rendered screen backgrounds so they are rebuilt at the new size."""
+        self._menu_grid = None
+        self._leaderboard_bg = None
+        self._leaderboard_bg_key = None
+        self._settings_bg = None
+        self._pause_overlay = None
+        self._fade_overlay = None
+    
+    def _get_overlay(self, overlay, alpha: int) -> pygame.Surface:
+        """Return a black screen-sized overlay at the given alpha, rebuilding it on size change."""
+        size = (self.game.current_width, self.game.current_height)
+        if overlay is None or overlay.get_size() != size:
+            # Converted to the display format so blits skip per-pixel conversion
+            overlay = pygame.Surface(size).convert()
+            overlay.fill((0, 0, 0))
+        overlay.set_alpha(alpha)
+        return overlay
+    
     def update_menu_animations(self, width, height):
         """Update menu animations."""
         # Update title animation
@@ -252,7 +290,7 @@ class StateManager:
     
     # ==================== STATE HANDLERS ====================
     
-    async def handle_menu_state(self, events, mouse_pos):
+    async def handle_menu_state(self, events, mouse_pos, dt=None, buckets=None):
         """Handle menu state with animated cyberpunk background."""
         if not self.game:
             return
@@ -267,13 +305,16 @@ class StateManager:
         # Draw cyberpunk background
         self.game.screen.blit(self.menu_background, (0, 0))
         
-        # Draw animated grid overlay
-        grid_surface = pygame.Surface((self.game.current_width, self.game.current_height), pygame.SRCALPHA)
-        for y in range(int(-self.grid_offset), self.game.current_height, 20):
-            alpha = int(100 * (1 - (abs(y - self.game.current_height/2) / (self.game.current_height/2))))
+        # Draw animated grid overlay; the lines repeat every 20px, so one
+        # pre-drawn strip scrolled by the offset covers the whole screen
+        if self._menu_grid is None:
+            self._menu_grid = pygame.Surface(
+                (self.game.current_width, self.game.current_height + 20), pygame.SRCALPHA
+            ).convert_alpha()
             line_color = (0, 150, 255)
-            pygame.draw.line(grid_surface, line_color, (0, y), (self.game.current_width, y), 1)
-        self.game.screen.blit(grid_surface, (0, 0))
+            for y in range(0, self.game.current_height + 20, 20):
+                pygame.draw.line(self._menu_grid, line_color, (0, y), (self.game.current_width, y), 1)
+        self.game.screen.blit(self._menu_grid, (0, int(-self.grid_offset) % 20 - 20))
         
         # Draw data particles
         for particle in self.data_particles:
@@ -281,33 +322,46 @@ class StateManager:
                              (int(particle["x"]), int(particle["y"])), 
                              particle["size"])
         
-        # Draw title with glow effect
-        title_text = "CODEBREAK"
-        title_font = self.game.font_manager.get_title_font()
-        subtitle_font = self.game.font_manager.get_info_font()
-        
-        # Colors
-        NEON_BLUE = (0, 195, 255)
-        WHITE = (255, 255, 255)
+        # Title, glow, subtitle and version text never change; only their
+        # positions and the subtitle alpha animate
+        if self._menu_text is None:
+            title_text = "CODEBREAK"
+            title_font = self.game.font_manager.get_title_font()
+            subtitle_font = self.game.font_manager.get_info_font()
+            
+            # Colors
+            NEON_BLUE = (0, 195, 255)
+            WHITE = (255, 255, 255)
+            
+            # Glow effect for the title
+            glow_size = title_font.size(title_text)
+            glow_surf = pygame.Surface((glow_size[0] + 20, glow_size[1] + 20), pygame.SRCALPHA)
+            for i in range(10, 0, -1):
+                alpha = 20 - i*2
+                size = i*2
+                pygame.draw.rect(glow_surf, (*NEON_BLUE, alpha), 
+                               (10-i, 10-i, glow_size[0]+size, glow_size[1]+size), 
+                               border_radius=10)
+            
+            self._menu_text = {
+                "glow": glow_surf,
+                "title": title_font.render(title_text, True, WHITE),
+                "subtitle": subtitle_font.render("A Digital Survival Game", True, (180, 180, 255)),
+                "version": subtitle_font.render("v1.0", True, (100, 100, 150))
+            }
+        menu_text = self._menu_text
         
-        # Add glow effect to title
-        glow_size = title_font.size(title_text)
-        glow_surf = pygame.Surface((glow_size[0] + 20, glow_size[1] + 20), pygame.SRCALPHA)
-        for i in range(10, 0, -1):
-            alpha = 20 - i*2
-            size = i*2
-            pygame.draw.rect(glow_surf, (*NEON_BLUE, alpha), 
-                           (10-i, 10-i, glow_size[0]+size, glow_size[1]+size), 
-                           border_radius=10)
-        self.game.screen.blit(glow_surf, (self.game.current_width // 2 - (glow_size[0] + 20) // 2, int(self.title_y) - 10))
+        # Draw title with glow effect
+        glow_surf = menu_text["glow"]
+        self.game.screen.blit(glow_surf, (self.game.current_width // 2 - glow_surf.get_width() // 2, int(self.title_y) - 10))
         
         # Draw title and subtitle
-        title_surf = title_font.render(title_text, True, WHITE)
+        title_surf = menu_text["title"]
         title_rect = title_surf.get_rect(center=(self.game.current_width // 2, int(self.title_y)))
         self.game.screen.blit(title_surf, title_rect)
         
         # Draw subtitle with fade-in
-        subtitle_surf = subtitle_font.render("A Digital Survival Game", True, (180, 180, 255))
+        subtitle_surf = menu_text["subtitle"]
         subtitle_surf.set_alpha(int(self.subtitle_alpha))
         subtitle_rect = subtitle_surf.get_rect(center=(self.game.current_width // 2, int(self.title_y) + 60))
         self.game.screen.blit(subtitle_surf, subtitle_rect)
@@ -318,7 +372,7 @@ class StateManager:
             button.draw(self.game.screen, self.game.font_manager.get_button_font())
         
         # Draw version info
-        version_text = subtitle_font.render("v1.0", True, (100, 100, 150))
+        version_text = menu_text["version"]
         self.game.screen.blit(version_text, (self.game.current_width - version_text.get_width() - 10, 
                                             self.game.current_height - version_text.get_height() - 10))
         
@@ -326,7 +380,7 @@ class StateManager:
         for event in events:
             self.game.ui_manager.handle_events(self.game.ui_manager.menu_buttons, event)
     
-    async def handle_pause_state(self, events, mouse_pos):
+    async def handle_pause_state(self, events, mouse_pos, dt=None, buckets=None):
         """Handle pause state."""
         if not self.game:
             return
@@ -335,14 +389,11 @@ class StateManager:
         self.game.draw_gameplay_elements()
         
         # Colors
-        BLACK = (0, 0, 0)
         NEON_PINK = (255, 41, 117)
         
         # Draw semi-transparent overlay
-        overlay = pygame.Surface((self.game.current_width, self.game.current_height))
-        overlay.set_alpha(180)
-        overlay.fill(BLACK)
-        self.game.screen.blit(overlay, (0, 0))
+        self._pause_overlay = self._get_overlay(self._pause_overlay, 180)
+        self.game.screen.blit(self._pause_overlay, (0, 0))
         
         # Draw pause text
         pause_surf = self.game.font_manager.get_xl_font().render("PAUSED", True, NEON_PINK)
@@ -358,7 +409,7 @@ class StateManager:
         for event in events:
             self.game.ui_manager.handle_events(self.game.ui_manager.pause_buttons, event)
     
-    async def handle_game_over_state(self, events, mouse_pos):
+    async def handle_game_over_state(self, events, mouse_pos, dt=None, buckets=None):
         """Handle game over state."""
         if not self.game:
             return
@@ -372,13 +423,15 @@ class StateManager:
         
         # Submit score if not already submitted
         if not self.game.score_submitted and self.game.auth_manager.is_authenticated():
-            self.game.leaderboard_manager.submit_score(
+            # Posted off the event loop; the game over screen keeps drawing
+            self._score_submit = asyncio.create_task(asyncio.to_thread(
+                self.game.leaderboard_manager.submit_score,
                 self.game.auth_manager.username,
                 self.game.score,
                 self.game.survival_time,
                 self.game.wave_number,
                 self.game.game_id  # Pass game_id for game-specific leaderboards
-            )
+            ))
             self.game.score_submitted = True
         
         # Draw game over text
@@ -409,7 +462,7 @@ class StateManager:
         for event in events:
             self.game.ui_manager.handle_events(self.game.ui_manager.game_over_buttons, event)
     
-    async def handle_leaderboard_state(self, events, mouse_pos):
+    async def handle_leaderboard_state(self, events, mouse_pos, dt=None, buckets=None):
         """Handle leaderboard state."""
         if not self.game:
             return
@@ -421,72 +474,91 @@ class StateManager:
         WHITE = (255, 255, 255)
         GRAY = (150, 150, 150)
         
-        self.game.screen.fill(BG_COLOR)
-        
         # Set game_id in leaderboard manager if not already set
         if self.game.game_id and not self.game.leaderboard_manager.current_game_id:
             self.game.leaderboard_manager.set_game_id(self.game.game_id)
         
         # Fetch leaderboard if needed
         if self.game.leaderboard_manager.needs_update():
-            self.game.leaderboard_manager.fetch_leaderboard()
+            self._start_leaderboard_fetch()
         
-        # Draw title with view mode indicator
         view_mode = self.game.leaderboard_manager.get_view_mode()
-        title_text = "GLOBAL LEADERBOARD" if view_mode == "global" else "GAME LEADERBOARD"
-        title_surf = self.game.font_manager.get_xl_font().render(title_text, True, NEON_BLUE)
-        title_rect = title_surf.get_rect(center=(self.game.current_width // 2, 80))
-        self.game.screen.blit(title_surf, title_rect)
-        
-        # Draw toggle buttons if game leaderboard is available
-        if self.game.leaderboard_manager.can_view_game_leaderboard():
-            button_y = 130
-            button_width = 150
-            button_height = 35
-            spacing = 20
-            total_width = (button_width * 2) + spacing
-            start_x = (self.game.current_width - total_width) // 2
+        can_view_game = self.game.leaderboard_manager.can_view_game_leaderboard()
+        
+        # Toggle button layout
+        button_y = 130
+        button_width = 150
+        button_height = 35
+        spacing = 20
+        total_width = (button_width * 2) + spacing
+        start_x = (self.game.current_width - total_width) // 2
+        global_rect = pygame.Rect(start_x, button_y, button_width, button_height)
+        game_rect = pygame.Rect(start_x + button_width + spacing, button_y, button_width, button_height)
+        
+        # Everything but the back button only changes with the view mode or
+        # a fetch, so it is composited once into a background; the entry
+        # rows are rendered here once per fetch rather than every frame
+        bg_key = (view_mode, can_view_game, self.game.leaderboard_manager.entries_version)
+        if self._leaderboard_bg is None or self._leaderboard_bg_key != bg_key:
+            entries = self.game.leaderboard_manager.get_top_n(10)
+            bg = pygame.Surface((self.game.current_width, self.game.current_height)).convert()
+            bg.fill(BG_COLOR)
+            
+            # Draw title with view mode indicator
+            title_text = "GLOBAL LEADERBOARD" if view_mode == "global" else "GAME LEADERBOARD"
+            title_surf = self.game.font_manager.get_xl_font().render(title_text, True, NEON_BLUE)
+            title_rect = title_surf.get_rect(center=(self.game.current_width // 2, 80))
+            bg.blit(title_surf, title_rect)
+            
+            # Draw toggle buttons if game leaderboard is available
+            if can_view_game:
+                # Global button
+                global_color = NEON_BLUE if view_mode == "global" else GRAY
+                pygame.draw.rect(bg, global_color, global_rect, 2)
+                global_text = self.game.font_manager.get_sm_font().render("GLOBAL", True, global_color)
+                global_text_rect = global_text.get_rect(center=global_rect.center)
+                bg.blit(global_text, global_text_rect)
+                
+                # Game button
+                game_color = NEON_PINK if view_mode == "game" else GRAY
+                pygame.draw.rect(bg, game_color, game_rect, 2)
+                game_text = self.game.font_manager.get_sm_font().render("THIS GAME", True, game_color)
+                game_text_rect = game_text.get_rect(center=game_rect.center)
+                bg.blit(game_text, game_text_rect)
             
-            # Global button
-            global_color = NEON_BLUE if view_mode == "global" else GRAY
-            global_rect = pygame.Rect(start_x, button_y, button_width, button_height)
-            pygame.draw.rect(self.game.screen, global_color, global_rect, 2)
-            global_text = self.game.font_manager.get_sm_font().render("GLOBAL", True, global_color)
-            global_text_rect = global_text.get_rect(center=global_rect.center)
-            self.game.screen.blit(global_text, global_text_rect)
+            # Draw leaderboard entries
+            y_offset = 180 if can_view_game else 150
+            md_font = self.game.font_manager.get_md_font()
+            center_x = self.game.current_width // 2
             
-            # Game button
-            game_color = NEON_PINK if view_mode == "game" else GRAY
-            game_rect = pygame.Rect(start_x + button_width + spacing, button_y, button_width, button_height)
-            pygame.draw.rect(self.game.screen, game_color, game_rect, 2)
-            game_text = self.game.font_manager.get_sm_font().render("THIS GAME", True, game_color)
-            game_text_rect = game_text.get_rect(center=game_rect.center)
-            self.game.screen.blit(game_text, game_text_rect)
+            row_blits = []
+            for i, entry in enumerate(entries):
+                rank_text = f"{i + 1}. {entry['name']}: {entry['score']}"
+                rank_surf = md_font.render(rank_text, True, WHITE)
+                row_blits.append((rank_surf, rank_surf.get_rect(center=(center_x, y_offset))))
+                y_offset += 40
+            bg.blits(row_blits, doreturn=False)
             
-            # Handle toggle button clicks
+            self._leaderboard_bg = bg
+            self._leaderboard_bg_key = bg_key
+            self.screen_rebuilt = True
+        
+        self.game.screen.blit(self._leaderboard_bg, (0, 0))
+        
+        # Handle toggle button clicks
+        if can_view_game:
             for event in events:
                 if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                     if global_rect.collidepoint(event.pos):
                         self.game.leaderboard_manager.set_view_mode("global")
-                        self.game.leaderboard_manager.fetch_leaderboard(force=True)
+                        self._start_leaderboard_fetch(force=True)
                     elif game_rect.collidepoint(event.pos):
                         self.game.leaderboard_manager.set_view_mode("game")
-                        self.game.leaderboard_manager.fetch_leaderboard(force=True)
-        
-        # Draw leaderboard entries
-        entries = self.game.leaderboard_manager.get_entries()
-        y_offset = 180 if self.game.leaderboard_manager.can_view_game_leaderboard() else 150
-        
-        for i, entry in enumerate(entries[:10]):
-            rank_text = f"{i + 1}. {entry['name']}: {entry['score']}"
-            rank_surf = self.game.font_manager.get_md_font().render(rank_text, True, WHITE)
-            rank_rect = rank_surf.get_rect(center=(self.game.current_width // 2, y_offset))
-            self.game.screen.blit(rank_surf, rank_rect)
-            y_offset += 40
+                        self._start_leaderboard_fetch(force=True)
         
         # Update and draw back button
         if self.game.ui_manager.leaderboard_back_button:
-            self.game.ui_manager.leaderboard_back_button.update(mouse_pos)
+            self.game.ui_manager.update_widgets((self.game.ui_manager.leaderboard_back_button,), mouse_pos)
             self.game.ui_manager.leaderboard_back_button.draw(
                 self.game.screen, 
                 self.game.font_manager.get_button_font()
@@ -511,7 +583,21 @@ class StateManager:
             if self.game.ui_manager.leaderboard_back_button:
                 self.game.ui_manager.leaderboard_back_button.handle_event(event)
     
-    async def handle_settings_state(self, events, mouse_pos):
+    def _start_leaderboard_fetch(self, force: bool = False):
+        """Fetch the leaderboard on a worker thread so frames never wait on HTTP.
+        
+        Periodic refreshes are skipped while one is in flight; forced fetches
+        (view mode changes) always start, since the pending one may be for
+        the old mode. LeaderboardManager discards results from any fetch
+        that a later one has superseded.
+        """
+        if not force and self._leaderboard_fetch and not self._leaderboard_fetch.done():
+            return
+        self._leaderboard_fetch = asyncio.create_task(asyncio.to_thread(
+            self.game.leaderboard_manager.fetch_leaderboard, force
+        ))
+    
+    async def handle_settings_state(self, events, mouse_pos, dt=None, buckets=None):
         """Handle settings state."""
         if not self.game:
             return
@@ -520,12 +606,17 @@ class StateManager:
         BG_COLOR = (10, 10, 25)
         NEON_BLUE = (0, 195, 255)
         
-        self.game.screen.fill(BG_COLOR)
-        
-        # Draw title
-        title_surf = self.game.font_manager.get_xl_font().render("SETTINGS", True, NEON_BLUE)
-        title_rect = title_surf.get_rect(center=(self.game.current_width // 2, 80))
-        self.game.screen.blit(title_surf, title_rect)
+        # Background fill and title are static; composite them once
+        if self._settings_bg is None:
+            bg = pygame.Surface((self.game.current_width, self.game.current_height)).convert()
+            bg.fill(BG_COLOR)
+            
+            # Draw title
+            title_surf = self.game.font_manager.get_xl_font().render("SETTINGS", True, NEON_BLUE)
+            title_rect = title_surf.get_rect(center=(self.game.current_width // 2, 80))
+            bg.blit(title_surf, title_rect)
+            self._settings_bg = bg
+        self.game.screen.blit(self._settings_bg, (0, 0))
         
         # Update and draw controls
         self.game.ui_manager.update_widgets(self.game.ui_manager.settings_controls, mouse_pos)
@@ -543,8 +634,5 @@ class StateManager:
             
         alpha = self.get_fade_alpha()
         if alpha > 0:
-            BLACK = (0, 0, 0)
-            overlay = pygame.Surface((self.game.current_width, self.game.current_height))
-            overlay.set_alpha(alpha)
-            overlay.fill(BLACK)
-            self.game.screen.blit(overlay, (0, 0))
\ No newline at end of file
+            self._fade_overlay = self._get_overlay(self._fade_overlay, alpha)
+            self.game.screen.blit(self._fade_overlay, (0, 0))
\ No newline at end of file
@@ -0,0 +1,56 @@
+"""
+Test remote player interpolation and dead reckoning in Game._remote_player_position
+"""
+
+from collections import deque
+
+from game import Game
+
+
+def _stopped_player(sample_rate=15, step=20, stop_x=100):
+    """Samples of a remote player walking right at sample_rate Hz, stopping at stop_x."""
+    interval = 1 / sample_rate
+    samples = deque(maxlen=8)
+    xs = range(stop_x - step * 7, stop_x + 1, step)
+    for i, x in enumerate(xs):
+        samples.append((i * interval, float(x), 0.0))
+    return {"samples": samples, "vx": step * sample_rate, "vy": 0.0}
+
+
+def test_interpolates_between_samples():
+    """A render time between two samples lands between their positions"""
+    game = Game.__new__(Game)
+    player_data = _stopped_player()
+    t0, x0, _ = player_data["samples"][-2]
+    t1, x1, _ = player_data["samples"][-1]
+    x, y = game._remote_player_position(player_data, (t0 + t1) / 2)
+    assert abs(x - (x0 + x1) / 2) < 1e-6
+    assert y == 0.0
+
+
+def test_stopped_player_settles_on_last_sample():
+    """A player who stopped sending is not drawn past where they stopped"""
+    game = Game.__new__(Game)
+    player_data = _stopped_player()
+    newest_t, newest_x, _ = player_data["samples"][-1]
+    limit = Game.REMOTE_EXTRAPOLATE_LIMIT
+    
+    # Dead reckoning still runs ahead briefly after the newest sample
+    x, _ = game._remote_player_position(player_data, newest_t + limit / 2)
+    assert x > newest_x
+    
+    # ...but eases back onto the last sample and stays there
+    for later in (2 * limit, 5.0, 60.0):
+        x, _ = game._remote_player_position(player_data, newest_t + later)
+        assert x == newest_x, f"drawn at {x} {later}s after stopping at {newest_x}"
+
+
+if __name__ == "__main__":
+    import sys
+    try:
+        test_interpolates_between_samples()
+        test_stopped_player_settles_on_last_sample()
+    except AssertionError as e:
+        print(f"✗ TEST FAILED: {e}")
+        sys.exit(1)
+    print("✓ ALL TESTS PASSED")
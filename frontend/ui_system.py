@@ -228,6 +228,8 @@ class UIManager:
         self.game_over_buttons = []
         self.settings_controls = []
         self.leaderboard_back_button = None
+        # Rects of widgets whose hover state changed since the last present
+        self.dirty_rects = []
         
     def create_menu_buttons(self, callbacks):
         """Create main menu buttons."""
@@ -348,7 +350,17 @@ class UIManager:
     def update_widgets(self, widgets, mouse_pos):
         """Update all widgets with current mouse position."""
         for widget in widgets:
+            was_hovered = widget.hovered
             widget.update(mouse_pos)
+            if widget.hovered != was_hovered:
+                self.dirty_rects.append(widget.rect)
+    
+    def has_live_widget(self) -> bool:
+        """Check if a slider is being dragged or a dropdown is open."""
+        for widget in self.settings_controls:
+            if getattr(widget, 'active', False) or getattr(widget, 'expanded', False):
+                return True
+        return False
     
     def handle_events(self, widgets, event):
         """Handle events for all widgets."""
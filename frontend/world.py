@@ -1,5 +1,6 @@
 import pygame
 import random
+import math
 from worldObject import WorldObject
 
 class WorldGenerator:
@@ -39,6 +40,15 @@ class WorldGenerator:
         self.animation_timer = 0
         self.init_background_effects()
         
+        # Static background layers, rendered once on first draw
+        self._static_bg = None
+        self._grid_overlay = None
+        
+        # Block glow and particle surfaces, pre-rendered the first time each
+        # (color, size, intensity) combination is drawn and blitted afterwards
+        self._glow_cache = {}
+        self._particle_cache = {}
+        
         # Generate world
         self.generate_map()
         self.place_objects()
@@ -122,22 +132,47 @@ class WorldGenerator:
             new_object = WorldObject(x, y, obj_type)
             self.objects.append(new_object)
 
+    def _build_static_layers(self):
+        """Render the background fill, depth lines and grid into reusable surfaces."""
+        size = (self.width, self.height)
+        
+        # Fill plus the subtle vertical depth lines
+        static_bg = pygame.Surface(size).convert()
+        static_bg.fill(self.bg_color)
+        depth_color = (30, 30, 60 + 20)
+        for x in range(0, self.width, self.tile_size * 2):
+            pygame.draw.line(static_bg, depth_color, (x, 0), (x, self.height), 1)
+        
+        # Grid lines go over the data streams, so they get their own
+        # colorkeyed layer blitted after the streams are drawn
+        grid_overlay = pygame.Surface(size).convert()
+        grid_overlay.fill((0, 0, 0))
+        grid_overlay.set_colorkey((0, 0, 0))
+        for x in range(0, self.width, self.tile_size):
+            pygame.draw.line(grid_overlay, self.grid_color, (x, 0), (x, self.height))
+        for y in range(0, self.height, self.tile_size):
+            pygame.draw.line(grid_overlay, self.grid_color, (0, y), (self.width, y))
+        
+        self._static_bg = static_bg
+        self._grid_overlay = grid_overlay
+    
     def draw_map(self, surface):
         """Draw the world map with cyberpunk-styled 3D data node blocks."""
+        if self._static_bg is None:
+            self._build_static_layers()
+        
         # Fill background
         surface.fill(self.bg_color)
+        surface.blit(self._static_bg, (0, 0))
         
         # Draw animated background effects
-        self.draw_animated_background(surface)
+        self.draw_data_streams(surface)
         
         # Update animation timer
         self.animation_timer += 1
         
         # Draw grid lines with slight glow
-        for x in range(0, self.width, self.tile_size):
-            pygame.draw.line(surface, self.grid_color, (x, 0), (x, self.height))
-        for y in range(0, self.height, self.tile_size):
-            pygame.draw.line(surface, self.grid_color, (0, y), (self.width, y))
+        surface.blit(self._grid_overlay, (0, 0))
         
         # Draw cyberpunk data node blocks
         # Draw from back to front to handle overlapping correctly
@@ -150,7 +185,6 @@ class WorldGenerator:
             base_y = y * self.tile_size
             
             # Calculate pulsing effect
-            import math
             pulse_phase = (self.animation_timer * block['pulse_speed'] + block['pulse_offset']) % 360
             pulse_intensity = (math.sin(math.radians(pulse_phase)) + 1) / 2  # 0 to 1
             
@@ -184,12 +218,7 @@ class WorldGenerator:
             
             # Draw glow effect behind block
             glow_size = int(10 + pulse_intensity * 15)
-            glow_surf = pygame.Surface((self.tile_size + glow_size * 2, self.tile_size + glow_size * 2), pygame.SRCALPHA)
-            for i in range(glow_size, 0, -1):
-                alpha = int((pulse_intensity * 30) * (1 - i / glow_size))
-                pygame.draw.rect(glow_surf, (*base_color, alpha), 
-                               (glow_size - i, glow_size - i, self.tile_size + i*2, self.tile_size + i*2),
-                               border_radius=5)
+            glow_surf = self._get_block_glow(base_color, glow_size, round(pulse_intensity * 30))
             surface.blit(glow_surf, (base_x - glow_size, base_y - glow_size))
             
             # Draw faces in correct order (back to front)
@@ -226,25 +255,52 @@ class WorldGenerator:
                     particle_y = base_y - self.block_height - 10 - (particle_offset / 360) * 20
                     particle_alpha = int(255 * (1 - particle_offset / 360))
                     if particle_alpha > 0:
-                        particle_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
-                        pygame.draw.circle(particle_surf, (*base_color, particle_alpha), (2, 2), 2)
+                        particle_surf = self._get_particle_surface(base_color, particle_alpha)
                         surface.blit(particle_surf, (node_center_x - 2, int(particle_y)))
         
         # Draw world objects (consoles, crates, terminals, debris)
         for obj in self.objects:
             obj.draw(surface)
     
-    def draw_animated_background(self, surface):
-        """Draw animated background effects (moving grid and data streams)."""
+    def _get_block_glow(self, color, glow_size, intensity):
+        """
+        Return the glow drawn behind a block, building it on first use.
+        
+        Args:
+            color: Block base color
+            glow_size: Glow thickness in pixels around the tile
+            intensity: Pulse intensity scaled to 0-30 (the glow's peak alpha)
+        """
+        key = (color, glow_size, intensity)
+        glow_surf = self._glow_cache.get(key)
+        if glow_surf is None:
+            size = self.tile_size + glow_size * 2
+            glow_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            for i in range(glow_size, 0, -1):
+                alpha = int(intensity * (1 - i / glow_size))
+                pygame.draw.rect(glow_surf, (*color, alpha), 
+                               (glow_size - i, glow_size - i, self.tile_size + i*2, self.tile_size + i*2),
+                               border_radius=5)
+            glow_surf = glow_surf.convert_alpha()
+            self._glow_cache[key] = glow_surf
+        return glow_surf
+    
+    def _get_particle_surface(self, color, alpha):
+        """Return a small translucent particle dot, building it on first use."""
+        key = (color, alpha)
+        particle_surf = self._particle_cache.get(key)
+        if particle_surf is None:
+            particle_surf = pygame.Surface((4, 4), pygame.SRCALPHA)
+            pygame.draw.circle(particle_surf, (*color, alpha), (2, 2), 2)
+            particle_surf = particle_surf.convert_alpha()
+            self._particle_cache[key] = particle_surf
+        return particle_surf
+    
+    def draw_data_streams(self, surface):
+        """Advance and draw the falling data streams."""
         # Animate grid offset
         self.grid_offset_y = (self.grid_offset_y + 1) % self.tile_size
         
-        # Draw subtle moving vertical lines for depth
-        for x in range(0, self.width, self.tile_size * 2):
-            alpha_value = 20
-            color = (30, 30, 60 + alpha_value)
-            pygame.draw.line(surface, color, (x, 0), (x, self.height), 1)
-        
         # Update and draw data streams
         for stream in self.data_streams:
             stream['y'] += stream['speed']
@@ -2,30 +2,54 @@ import random
 import pygame
 import math
 
+# Pulse-scaled copies of resource sprites, keyed by (sprite, width, height);
+# the pulse only ever produces a handful of sizes per sprite
+_scaled_sprite_cache = {}
+
+
+def get_scaled_sprite(sprite, width, height):
+    """Return sprite scaled to (width, height), scaling it only the first time."""
+    key = (sprite, width, height)
+    scaled = _scaled_sprite_cache.get(key)
+    if scaled is None:
+        scaled = pygame.transform.scale(sprite, (width, height))
+        _scaled_sprite_cache[key] = scaled
+    return scaled
+
+
 class Resource:
     """Collectible resource that players can pick up."""
     
+    # Color coding by type
+    COLORS = {
+        "code_fragments": (0, 255, 255),      # Cyan
+        "energy_cores": (255, 215, 0),        # Gold
+        "data_shards": (255, 41, 117)         # Neon Pink
+    }
+    
     def __init__(self, x, y, resource_type, amount=1, sprite=None):
+        self.width = 24
+        self.height = 24
+        # Resources never move (float_offset is visual only), so the
+        # collision box is built once; collidelistall() reads it directly
+        self.rect = pygame.Rect(x, y, self.width, self.height)
+        self.colors = self.COLORS
+        self.reset(x, y, resource_type, amount, sprite)
+    
+    def reset(self, x, y, resource_type, amount=1, sprite=None):
+        """Reinitialize this resource in place so pooled instances can be reused."""
         self.x = x
         self.y = y
         self.type = resource_type  # "code_fragments", "energy_cores", "data_shards"
         self.amount = amount
         self.sprite = sprite  # Optional sprite image
-        self.width = 24
-        self.height = 24
+        self.rect.update(x, y, self.width, self.height)
         
         # Visual properties
         self.pulse_timer = 0
         self.float_offset = 0
         self.base_y = y
-        
-        # Color coding by type
-        self.colors = {
-            "code_fragments": (0, 255, 255),      # Cyan
-            "energy_cores": (255, 215, 0),        # Gold
-            "data_shards": (255, 41, 117)         # Neon Pink
-        }
-        self.base_color = self.colors.get(resource_type, (255, 255, 255))
+        self.base_color = self.COLORS.get(resource_type, (255, 255, 255))
     
     def update(self, dt):
         """Update resource animation."""
@@ -37,6 +61,20 @@ class Resource:
         
     def draw(self, surface, camera_system=None):
         """Draw the resource with animated effects."""
+        blits = []
+        self.add_blits(surface, blits, camera_system)
+        if blits:
+            surface.blits(blits, doreturn=False)
+    
+    def add_blits(self, surface, blits, camera_system=None):
+        """
+        Draw the resource's glow and shapes, queueing its sprite for a batched blit.
+        
+        Args:
+            surface: Surface the glow and procedural shapes are drawn on now
+            blits: List that receives a (sprite, position) pair to blit later
+            camera_system: Camera used to convert world to screen coordinates
+        """
         # Calculate screen position
         if camera_system:
             screen_x, screen_y = camera_system.apply(self.x, self.y + self.float_offset)
@@ -56,7 +94,7 @@ class Resource:
             # Scale sprite for pulse effect
             scaled_width = int(self.sprite.get_width() * pulse_scale)
             scaled_height = int(self.sprite.get_height() * pulse_scale)
-            scaled_sprite = pygame.transform.scale(self.sprite, (scaled_width, scaled_height))
+            scaled_sprite = get_scaled_sprite(self.sprite, scaled_width, scaled_height)
             
             # Center the scaled sprite
             sprite_x -= (scaled_width - self.width) // 2
@@ -70,8 +108,8 @@ class Resource:
                               int(screen_y + self.height // 2)), 
                              glow_radius)
             
-            # Draw the sprite
-            surface.blit(scaled_sprite, (sprite_x, sprite_y))
+            # Queue the sprite; the caller blits every queued sprite at once
+            blits.append((scaled_sprite, (sprite_x, sprite_y)))
         else:
             # Fallback to procedural graphics if no sprite
             # Pulsing glow effect
@@ -122,7 +160,7 @@ class Resource:
     
     def get_rect(self):
         """Get collision rectangle for the resource."""
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        return self.rect.copy()
 
 
 class WorldObject: